@@ -1,6 +1,5 @@
-from ..utils import to_datetime_anything
+from ..utils import to_datetime_anything, format_base_timestamp
 from ..objects import Patient, Admission, LabResultSpecimen, Physician
-from ..config import BASE_TIMESTAMP_FORMAT
 from ..messages import generate_oul_r22_message
 from .basics import save_message_to_file
 
@@ -46,7 +45,7 @@ def create_oml_11(
     ]
     sorted_reported_times = sorted(all_reported_times)
     latest_reported_time = sorted_reported_times[-1]
-    message_time = latest_reported_time.strftime(BASE_TIMESTAMP_FORMAT)
+    message_time = format_base_timestamp(latest_reported_time)
 
     # Create a message
     oul_r22_message = generate_oul_r22_message(
@@ -1,6 +1,5 @@
-from ..utils import to_datetime_anything
+from ..utils import to_datetime_anything, format_base_timestamp
 from ..objects import Patient, PrescriptionOrder, Admission, Physician
-from ..config import BASE_TIMESTAMP_FORMAT
 from ..messages import generate_rde_o11_prescription_message
 from .basics import save_message_to_file
 
@@ -40,7 +39,7 @@ def create_omp_01(
             order.transaction_time == transaction_time
         ), "All orders must have the same transaction time."
     transaction_time_dt = to_datetime_anything(transaction_time)
-    message_time = transaction_time_dt.strftime(BASE_TIMESTAMP_FORMAT)
+    message_time = format_base_timestamp(transaction_time_dt)
 
     # Create a message
     rde_o11_message = generate_rde_o11_prescription_message(
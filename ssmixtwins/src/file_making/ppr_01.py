@@ -1,7 +1,6 @@
 from ..objects import Patient, Problem
-from ..config import BASE_TIMESTAMP_FORMAT
 from ..messages import generate_ppr_zd1_message
-from ..utils import to_datetime_anything
+from ..utils import to_datetime_anything, format_base_timestamp
 from .basics import save_message_to_file
 
 
@@ -30,7 +29,7 @@ def create_ppr_01(
     all_action_times = [to_datetime_anything(p.action_time) for p in problems]
     sorted_action_times = sorted(all_action_times)
     latest_action_time = sorted_action_times[-1]
-    message_time = latest_action_time.strftime(BASE_TIMESTAMP_FORMAT)
+    message_time = format_base_timestamp(latest_action_time)
 
     # Create a message
     ppr_zd1_message = generate_ppr_zd1_message(
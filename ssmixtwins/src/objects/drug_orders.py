@@ -1,20 +1,128 @@
 """
 Objects for drug orders.
+
+NOTE: Constructor validation is assert-based throughout this module. For
+trusted bulk ingestion, run Python with -O to strip the assertions instead
+of maintaining a separate unvalidated construction path (an object.__new__
+bypass would skip the field cleaning these constructors also perform).
 """
 
 import re
+import sys
 import random
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Literal
 from datetime import timedelta
 from .physician import Physician
-from ..tables import h7t_0119, merit_9_3, merit_9_4, udt_0162, jhsi_0002, udt_0164
-from ..utils import format_timestamp, to_datetime_anything
+from .orc import validate_and_format_orc_fields
+from ..tables import merit_9_3, merit_9_4, udt_0162, jhsi_0002, udt_0164
+from ..utils import (
+    combined_length_below,
+    format_timestamp,
+    format_base_timestamp,
+    to_datetime_anything,
+)
 from ..random_data import (
     NAME_TO_DOSE_FORM,
     NAME_TO_PRESCRIPTION_ROUTE,
     ROUTE_TO_PRESC_REPEST_PATTERNS,
 )
-from ..config import BASE_TIMESTAMP_FORMAT
+
+# Code-system and unit literals assigned into every order object.
+# Interned once so that millions of orders share a single string object
+# (smaller memory footprint, pointer-fast equality checks).
+_MR9P = sys.intern("MR9P")
+_CODE_99I02 = sys.intern("99I02")
+_ML = sys.intern("ML")
+_ML_NAME = merit_9_4[_ML]  # Resolved once; injection orders always dose in mL.
+# JAHIS placeholder for "value intentionally not specified" (RXE-3/RXE-5).
+# This is the two-character string '""', NOT an empty string.
+_NULL_DOSE = sys.intern('""')
+
+# Flattened keyword tables scanned against drug names.
+# NOTE: The mapping order is preserved when flattening, so the first matching
+# keyword still selects the same route / dose form as the nested scan did.
+_PRESC_ROUTE_KEYWORDS = tuple(
+    (kw, route) for route, kws in NAME_TO_PRESCRIPTION_ROUTE.items() for kw in kws
+)
+_DOSE_FORM_KEYWORDS = tuple(
+    (kw, form_code, v["dose_unit_code"], v["dispense_unit_code"])
+    for form_code, v in NAME_TO_DOSE_FORM.items()
+    for kw in v["keywords"]
+)
+
+# Keywords marking an injection component as a base solution ("B").
+# TODO: Add more keywords if needed.
+_INJECTION_BASE_KEYWORDS = (
+    "生食",
+    "生理食塩",
+    "ブドウ糖液",
+    "ブドウ糖注射液",
+    "ブドウ糖注",
+    "注射用水",
+    "蒸留水",
+    "ソリタ",
+    "ラクトリンゲル",
+    "ソリューゲン",
+    "ビカネイト",
+    "リプラス",
+    "NK",
+    "EL",
+    "マルトス",
+    "キリット",
+    "糖液",
+    "糖注",
+    "リンゲル",
+    "ハルトマン",
+    "ニソリ",
+    "ヴィーン",
+    "アクメイン",
+    "ペロール",
+    "ビカーボン",
+    "ボルベン",
+    "デキストラン",
+    "デノサリン",
+    "ソルデム",
+    "ラクテック",
+    "ソルアセト",
+    "ソルラクト",
+    "フィジオ",
+    "ビーフリード",
+    "エルネオパ",
+    "ハイカリック",
+)
+
+# Weighted pools for injection component sampling, stored as value tuples with
+# cumulative weights. random.choices() re-accumulates its weights on every
+# call; a module-level cumulative table needs only one random() plus one
+# binary search per draw.
+_BASE_QUANTITIES = ("100", "250", "500", "1000")
+_BASE_QUANTITY_CUM = (0.05, 0.10, 0.95, 1.0)
+_COMPONENT_MULTIPLIERS = (1, 2, 3, 4, 5)
+_COMPONENT_MULTIPLIER_CUM = (0.50, 0.75, 0.875, 0.9375, 1.0)
+
+# Key listings quoted in validation failure messages. Assert messages are
+# only evaluated on failure, but the listings are static, so build them once.
+_MERIT_9_3_KEYS = list(merit_9_3.keys())
+_MERIT_9_4_KEYS = list(merit_9_4.keys())
+_UDT_0162_KEYS = list(udt_0162.keys())
+_UDT_0164_KEYS = list(udt_0164.keys())
+_JHSI_0002_KEYS = list(jhsi_0002.keys())
+
+# Duration pools for prescription orders (admission vs outpatient).
+# Precomputed so the hot path is a single random.choice over the right pool.
+_ADMITTED_DURATIONS = tuple(str(d) for d in range(1, 8))  # 1 ~ 7 days
+_OUTPATIENT_DURATIONS = ("7", "30", "60", "90")
+
+# Quantity/unit extraction for injection component names (e.g., '25mg').
+# Compiled once at import instead of re.search re-compiling per component.
+_COMPONENT_QUANTITY_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(mg|g|μg)", re.IGNORECASE)
+_COMPONENT_UNIT_MAP = {
+    "mg": "MG",
+    "g": "G",
+    "μg": "MCG",
+}
 
 
 class PrescriptionOrder:
@@ -22,6 +130,38 @@ class PrescriptionOrder:
     This class represents a prescription order.
     """
 
+    # Orders are created in bulk (10^5+ per run), so the fixed slot layout
+    # avoids a per-instance __dict__.
+    __slots__ = (
+        "drug_code",
+        "drug_name",
+        "drug_code_system",
+        "dose_unit_code",
+        "dosage_form_code",
+        "minimum_dose",
+        "dispense_amount",
+        "dispense_unit_code",
+        "total_daily_dose",
+        "prescription_number",
+        "repeat_pattern_code",
+        "repeat_pattern_name",
+        "repeat_pattern_code_system",
+        "duration_in_days",
+        "start_time",
+        "end_time",
+        "total_occurrences",
+        "route_code",
+        "order_type",
+        "order_control",
+        "requester_order_number",
+        "filler_order_number",
+        "requester_group_number",
+        "transaction_time",
+        "order_effective_time",
+        "enterer",
+        "requester",
+    )
+
     def __init__(
         self,
         drug_code: str,
@@ -95,14 +235,15 @@ class PrescriptionOrder:
         # Validate and clean args
         assert drug_code != "", "drug_code must not be empty."
         assert drug_code_system != "", "drug_code_system must not be empty."
+        drug_full_len = len(drug_code) + len(drug_name) + len(drug_code_system)
         assert (
-            len(drug_code) + len(drug_name) + len(drug_code_system) < 230
-        ), f"drug_code, drug_name, and drug_code_system combined must be less than 230 characters, got {len(drug_code)+len(drug_name)+len(drug_code_system)}."
+            drug_full_len < 230
+        ), f"drug_code, drug_name, and drug_code_system combined must be less than 230 characters, got {drug_full_len}."
         assert minimum_dose != "", "minimum_dose must not be empty."
         # NOTE: Minimum dose can be empty for drugs whose minimum doses are hard to define (e.g., ointment).
         # But because RXE-3 is required, you must set something. Therefore, JAHIS制定標準 recommends to use '""' as a placeholder.
         # In this case, you must set '""' (not empty string!!!, be careful!) to this field.
-        if minimum_dose != '""':  # <- NOT empty string, but '""' (double quotes)
+        if minimum_dose != _NULL_DOSE:  # <- NOT empty string, but _NULL_DOSE (double quotes)
             assert (
                 minimum_dose.isdigit() and len(minimum_dose) <= 20
             ), f"minimum_dose must be a digit and less than 20 characters, got '{minimum_dose}'."
@@ -110,13 +251,13 @@ class PrescriptionOrder:
         # In this case, REX-5 is also '""'. But because REX-5 is deteermined by combination of dose_unit_code + dose_unit_name + dose_unit_code_system,
         # it is a bit complicated. Here, we set dose_unit_full to '""'. Then, let `generate_rxe()` to handle the final RXE-5 value.
         assert dose_unit_code != "", "dose_unit_code must not be empty."
-        if dose_unit_code != '""':  # <- NOT empty string, but '""' (double quotes)
+        if dose_unit_code != _NULL_DOSE:  # <- NOT empty string, but _NULL_DOSE (double quotes)
             assert (
                 dose_unit_code in merit_9_4
-            ), f"dose_unit_code must be one of {list(merit_9_4.keys())}, got '{dose_unit_code}'."
+            ), f"dose_unit_code must be one of {_MERIT_9_4_KEYS}, got '{dose_unit_code}'."
         assert dosage_form_code == "" or (
             dosage_form_code in merit_9_3
-        ), f"dosage_form_code must be one of {list(merit_9_3.keys())}, got '{dosage_form_code}'."
+        ), f"dosage_form_code must be one of {_MERIT_9_3_KEYS}, got '{dosage_form_code}'."
         # NOTE: dispense_amount, dispense_unit_code are REQUIRED in prescription, but not in injection.
         assert dispense_amount != "", "dispense_amount must not be empty."
         assert (
@@ -124,7 +265,7 @@ class PrescriptionOrder:
         ), f"dispense_amount must be a digit and less than 20 characters, got '{dispense_amount}'."
         assert (
             dispense_unit_code in merit_9_4
-        ), f"dispense_unit_code must be one of {list(merit_9_4.keys())}, got '{dispense_unit_code}'."
+        ), f"dispense_unit_code must be one of {_MERIT_9_4_KEYS}, got '{dispense_unit_code}'."
         if total_daily_dose != "":  # RXE-19
             assert dispense_amount.isdigit(), "total_daily_dose must be a digit."
         # NOTE; Prescription number is actually REQUIRED, even if the table says 'O' (optional). Tricky.
@@ -132,12 +273,14 @@ class PrescriptionOrder:
         assert (
             len(prescription_number) <= 20
         ), f"prescription_number must be less than 20 characters, got {len(prescription_number)}."
-        assert (
+        repeat_full_len = (
             len(repeat_pattern_code)
             + len(repeat_pattern_name)
             + len(repeat_pattern_code_system)
-            < 520
-        ), f"repeat_pattern_code, repeat_pattern_name, and repeat_pattern_code_system combined must be less than 520 characters, got {len(repeat_pattern_code)+len(repeat_pattern_name)+len(repeat_pattern_code_system)}."
+        )
+        assert (
+            repeat_full_len < 520
+        ), f"repeat_pattern_code, repeat_pattern_name, and repeat_pattern_code_system combined must be less than 520 characters, got {repeat_full_len}."
         if duration_in_days != "":
             assert (
                 duration_in_days.isdigit() and len(duration_in_days) <= 18
@@ -148,41 +291,19 @@ class PrescriptionOrder:
             ), f"total_occurrences must be a digit and less than 10 characters, got '{total_occurrences}'."
         assert (
             route_code in udt_0162
-        ), f"route_code must be one of {list(udt_0162.keys())}, got '{route_code}'."
-        assert order_type in [
-            "O",
-            "I",
-        ], f"order_type must be 'O' for outpatient or 'I' for inpatient, got '{order_type}'."
-        assert (
-            order_control in h7t_0119
-        ), "Invalid order_control. It is usually NW or CA. See h7t_0119."
-        assert (requester_order_number.isdigit()) and len(
-            requester_order_number
-        ) <= 15, f"requester_order_number must be a number shorter than 16 characters long, got '{requester_order_number}'."
-        if filler_order_number != "":
-            # NOTE: This part in PPR^ZD1 is ambiguous in the guideline. Assume it is 15-digit number.
-            assert (filler_order_number.isdigit()) and len(
-                filler_order_number
-            ) <= 16, f"filler_order_number must be a number shorter than 16 characters long, got '{filler_order_number}'."
-
-        assert (
-            recipe_number.isdigit() and len(recipe_number) == 2
-        ), f"recipe_number must be a 2-digit number, got '{recipe_number}'."
-        assert (
-            order_admin_number.isdigit() and len(order_admin_number) == 3
-        ), f"order_admin_number must be a 3-digit number, got '{order_admin_number}'."
-        assert isinstance(enterer, Physician), "enterer must be a Physician object."
-        assert isinstance(requester, Physician), "requester must be a Physician object."
-
-        # Format numbers
-        requester_order_number = requester_order_number.zfill(15)
-        if filler_order_number != "":
-            filler_order_number = filler_order_number.zfill(15)
-        # Requester_group_number logics
-        # NOTE: This logic is defined for injection orders. This is not excplicitly defined for prescription orders.
-        #       However, the logic for prescription orders is unclear in the guideline. Therefore, we use the same logic as injection orders.
-        requester_group_number = "_".join(
-            [requester_order_number, recipe_number, order_admin_number]
+        ), f"route_code must be one of {_UDT_0162_KEYS}, got '{route_code}'."
+        # Shared ORC validation and number formatting
+        requester_order_number, filler_order_number, requester_group_number = (
+            validate_and_format_orc_fields(
+                recipe_number,
+                order_admin_number,
+                order_control,
+                requester_order_number,
+                filler_order_number,
+                order_type,
+                enterer,
+                requester,
+            )
         )
         # Timestamps
         transaction_time = format_timestamp(
@@ -229,12 +350,41 @@ class PrescriptionOrder:
         self.enterer = enterer
         self.requester = requester
 
+    @classmethod
+    def from_records(cls, records: list[dict]) -> list["PrescriptionOrder"]:
+        """Creates PrescriptionOrder objects from a batch of keyword records.
+
+        Records destined for the same file repeat their ORC fields, and the
+        shared ORC validation is memoized, so constructing a batch through
+        this helper amortizes that validation across all records.
+
+        Args:
+            records (list[dict]): Keyword arguments for __init__, one dict per order.
+        Returns:
+            list[PrescriptionOrder]: The constructed orders, in input order.
+        """
+        return [cls(**record) for record in records]
+
+
 
 class InjectionComponent:
     """
     This class represents a component of an injection order.
     """
 
+    # Components are created in bulk (several per injection order), so the
+    # fixed slot layout avoids a per-instance __dict__.
+    __slots__ = (
+        "component_type",
+        "component_code",
+        "component_name",
+        "component_code_system",
+        "component_quantity",
+        "component_unit_code",
+        "component_unit_name",
+        "component_unit_code_system",
+    )
+
     def __init__(
         self,
         component_type: Literal["A", "B"],
@@ -256,29 +406,33 @@ class InjectionComponent:
             component_unit_code (str): The unit code for the component, must not be empty. Must be one of 'merit_9_4'.
         """
         # Validate
-        assert component_type in [
+        assert component_type in (
             "A",
             "B",
-        ], "component_type must be either A or B"
+        ), "component_type must be either A or B"
         assert component_code != "", "component_code must not be empty."
-        assert (
-            len(component_code) + len(component_name) + len(component_code_system) < 240
+        assert combined_length_below(
+            240, component_code, component_name, component_code_system
         ), "The combination of component_code, component_name, component_code_system is too long."
         assert (
             len(component_quantity) < 20
         ), "component_quantity must be less than 20-character long."
         # Check if component_quantity is a digit (can be float)
-        try:
-            # NOTE: Component quantity can be float, so .isdigit() is not appropriate here.
-            float(component_quantity)
-        except ValueError as e:
-            raise ValueError(
-                f"component_quantity must be a digit, got '{component_quantity}'."
-            ) from e
+        # Fast path: most quantities are plain ASCII integers, which need no
+        # float() parse (isascii() excludes unicode digits float() rejects).
+        if not (component_quantity.isascii() and component_quantity.isdigit()):
+            try:
+                # NOTE: Component quantity can be float, so .isdigit() is not appropriate here.
+                float(component_quantity)
+            except ValueError as e:
+                raise ValueError(
+                    f"component_quantity must be a digit, got '{component_quantity}'."
+                ) from e
         # NOTE: Component unit validation is minimum here, because the guideline is ambiguous.
+        component_unit_name = merit_9_4.get(component_unit_code)
         assert (
-            component_unit_code in merit_9_4
-        ), f"component_unit_code must be one of {list(merit_9_4.keys())}, got '{component_unit_code}'."
+            component_unit_name is not None
+        ), f"component_unit_code must be one of {_MERIT_9_4_KEYS}, got '{component_unit_code}'."
         # Set attributes
         self.component_type = component_type
         self.component_code = component_code
@@ -286,8 +440,8 @@ class InjectionComponent:
         self.component_code_system = component_code_system
         self.component_quantity = component_quantity
         self.component_unit_code = component_unit_code
-        self.component_unit_name = merit_9_4[component_unit_code]
-        self.component_unit_code_system = "MR9P"  # RXC-4 uses MR9P as the code system
+        self.component_unit_name = component_unit_name
+        self.component_unit_code_system = _MR9P  # RXC-4 uses MR9P as the code system
 
 
 class InjectionOrder:
@@ -295,6 +449,40 @@ class InjectionOrder:
     This class represents a injection order.
     """
 
+    __slots__ = (
+        "injection_type_code",
+        "injection_type_name",
+        "injection_type_code_system",
+        "dose_unit_code",
+        "dose_unit_name",
+        "dose_unit_code_system",
+        "minimum_dose",
+        "dispense_amount",
+        "dispense_unit_code",
+        "dispense_unit_name",
+        "dispense_unit_code_system",
+        "total_daily_dose",
+        "prescription_number",
+        "repeat_pattern_code",
+        "repeat_pattern_name",
+        "repeat_pattern_code_system",
+        "start_time",
+        "end_time",
+        "total_occurrences",
+        "route_code",
+        "route_device_code",
+        "components",
+        "order_type",
+        "order_control",
+        "requester_order_number",
+        "filler_order_number",
+        "requester_group_number",
+        "transaction_time",
+        "order_effective_time",
+        "enterer",
+        "requester",
+    )
+
     def __init__(
         self,
         injection_type_code: str,  # R, use jhsi_0002
@@ -376,11 +564,14 @@ class InjectionOrder:
 
         """
         # Validate and clean args
+        # NOTE: Table lookups are done once with .get(); the result doubles as
+        #       the membership check and the looked-up name.
+        injection_type_name = jhsi_0002.get(injection_type_code)
         assert (
-            injection_type_code in jhsi_0002
-        ), f"injection_type_code must be one of {list(jhsi_0002.keys())}, got '{injection_type_code}'."
+            injection_type_name is not None
+        ), f"injection_type_code must be one of {_JHSI_0002_KEYS}, got '{injection_type_code}'."
         assert minimum_dose != "", "minimum_dose must not be empty."
-        if minimum_dose != '""':  # <- NOT empty string, but '""' (double quotes)
+        if minimum_dose != _NULL_DOSE:  # <- NOT empty string, but _NULL_DOSE (double quotes)
             assert (
                 minimum_dose.isdigit() and len(minimum_dose) <= 20
             ), f"minimum_dose must be a digit and less than 20 characters, got '{minimum_dose}'."
@@ -388,7 +579,8 @@ class InjectionOrder:
         #       , we allow using codes not in merit_9_4.
         # NOTE: Implement ISO+ here if needed. Currently, we do not implement ISO+ because its list is too extensive.
         assert dose_unit_code != "", "dose_unit_name must not be empty."
-        if dose_unit_code not in merit_9_4:
+        dose_unit_name_in_table = merit_9_4.get(dose_unit_code)
+        if dose_unit_name_in_table is None:
             assert dose_unit_name != "", "dose_unit_name must not be empty."
             assert (
                 dose_unit_code_system != ""
@@ -401,7 +593,7 @@ class InjectionOrder:
             if dispense_unit_code != "":
                 assert (
                     dispense_unit_code in merit_9_4
-                ), f"dispense_unit_code must be one of {list(merit_9_4.keys())}, got '{dispense_unit_code}'."
+                ), f"dispense_unit_code must be one of {_MERIT_9_4_KEYS}, got '{dispense_unit_code}'."
         else:
             assert (
                 dispense_unit_code == ""
@@ -413,46 +605,38 @@ class InjectionOrder:
         assert (
             len(prescription_number) <= 20
         ), f"prescription_number must be less than 20 characters, got {len(prescription_number)}."
-        assert (
+        repeat_full_len = (
             len(repeat_pattern_code)
             + len(repeat_pattern_name)
             + len(repeat_pattern_code_system)
-            < 520
-        ), f"repeat_pattern_code, repeat_pattern_name, and repeat_pattern_code_system combined must be less than 520 characters, got {len(repeat_pattern_code)+len(repeat_pattern_name)+len(repeat_pattern_code_system)}."
+        )
+        assert (
+            repeat_full_len < 520
+        ), f"repeat_pattern_code, repeat_pattern_name, and repeat_pattern_code_system combined must be less than 520 characters, got {repeat_full_len}."
         if total_occurrences != "":
             assert (
                 total_occurrences.isdigit() and len(total_occurrences) <= 10
             ), f"total_occurrences must be a digit and less than 10 characters, got '{total_occurrences}'."
         assert (
             route_code in udt_0162
-        ), f"route_code must be one of {list(udt_0162.keys())}, got '{route_code}'."
+        ), f"route_code must be one of {_UDT_0162_KEYS}, got '{route_code}'."
         if route_device_code != "":
             assert (
                 route_device_code in udt_0164
-            ), f"route_device_code must be one of {list(udt_0164.keys())}, got '{route_device_code}'."
-        assert order_type in [
-            "O",
-            "I",
-        ], f"order_type must be 'O' for outpatient or 'I' for inpatient, got '{order_type}'."
-        assert (
-            order_control in h7t_0119
-        ), "Invalid order_control. It is usually NW or CA. See h7t_0119."
-        assert (requester_order_number.isdigit()) and len(
-            requester_order_number
-        ) <= 15, f"requester_order_number must be a number shorter than 16 characters long, got '{requester_order_number}'."
-        if filler_order_number != "":
-            # NOTE: This part in PPR^ZD1 is ambiguous in the guideline. Assume it is 15-digit number.
-            assert (filler_order_number.isdigit()) and len(
-                filler_order_number
-            ) <= 16, f"filler_order_number must be a number shorter than 16 characters long, got '{filler_order_number}'."
-        assert (
-            recipe_number.isdigit() and len(recipe_number) == 2
-        ), f"recipe_number must be a 2-digit number, got '{recipe_number}'."
-        assert (
-            order_admin_number.isdigit() and len(order_admin_number) == 3
-        ), f"order_admin_number must be a 3-digit number, got '{order_admin_number}'."
-        assert isinstance(enterer, Physician), "enterer must be a Physician object."
-        assert isinstance(requester, Physician), "requester must be a Physician object."
+            ), f"route_device_code must be one of {_UDT_0164_KEYS}, got '{route_device_code}'."
+        # Shared ORC validation and number formatting
+        requester_order_number, filler_order_number, requester_group_number = (
+            validate_and_format_orc_fields(
+                recipe_number,
+                order_admin_number,
+                order_control,
+                requester_order_number,
+                filler_order_number,
+                order_type,
+                enterer,
+                requester,
+            )
+        )
         assert isinstance(
             components, list
         ), "components must be a list of InjectionComponent objects."
@@ -462,22 +646,12 @@ class InjectionOrder:
             ), "Each component must be an instance of InjectionComponent."
 
         # Clean args
-        injection_type_name = jhsi_0002[injection_type_code]
-        injection_type_code_system = "99I02"
+        injection_type_code_system = _CODE_99I02
         dispense_unit_name = merit_9_4[dispense_unit_code]
-        dispense_unit_code_system = "MR9P"
-        if dose_unit_code in merit_9_4:
-            dose_unit_name = merit_9_4[dose_unit_code]
-            dose_unit_code_system = "MR9P"
-        requester_order_number = requester_order_number.zfill(15)
-        if filler_order_number != "":
-            filler_order_number = filler_order_number.zfill(15)
-        # Requester_group_number logics
-        # NOTE: This logic is defined for injection orders. This is not excplicitly defined for prescription orders.
-        #       However, the logic for prescription orders is unclear in the guideline. Therefore, we use the same logic as injection orders.
-        requester_group_number = "_".join(
-            [requester_order_number, recipe_number, order_admin_number]
-        )
+        dispense_unit_code_system = _MR9P
+        if dose_unit_name_in_table is not None:
+            dose_unit_name = dose_unit_name_in_table
+            dose_unit_code_system = _MR9P
         # Timestamps
         transaction_time = format_timestamp(
             transaction_time, format="YYYYMMDDHHMMSS", allow_null=True
@@ -528,6 +702,38 @@ class InjectionOrder:
         self.requester = requester
 
 
+@lru_cache(maxsize=4096)
+def _classify_drug(drug_name: str) -> tuple[str, str, str, str]:
+    """Classifies a drug name into route and dose-form codes.
+
+    Returns a (route_code, dosage_form_code, dose_unit_code,
+    dispense_unit_code) tuple. The keyword scans are deterministic per name
+    and real drug corpora repeat the same names many times, so the result is
+    memoized: a cache hit replaces both substring scans with one dict lookup.
+    """
+    # Route
+    # NOTE: 'kw in drug_name' is already a C-level substring check; the win here
+    # is scanning one flat tuple instead of iterating the nested dict per call.
+    route_code = "OTH"  # Set default, 'others'
+    for kw, k in _PRESC_ROUTE_KEYWORDS:
+        if kw in drug_name:
+            route_code = k
+            break
+
+    # Dose form & dose unit & dispense unit
+    dosage_form_code = ""  # Set default (null)
+    dose_unit_code = "DOSE"  # Set default first (~回分)
+    dispense_unit_code = "DOSE"  # Also set default first (~回分)
+    for kw, k, dose_unit, dispense_unit in _DOSE_FORM_KEYWORDS:
+        if kw in drug_name:
+            dosage_form_code = k
+            dose_unit_code = dose_unit
+            dispense_unit_code = dispense_unit
+            break
+
+    return route_code, dosage_form_code, dose_unit_code, dispense_unit_code
+
+
 def generate_random_prescription_order(
     drug_code: str,
     drug_name: str,
@@ -546,27 +752,26 @@ def generate_random_prescription_order(
     """
     Generates a random prescription order for testing purposes.
     """
+    # Pre-bind RNG methods as locals (skips the module attribute lookup per call)
+    randint = random.randint
+    choice = random.choice
+
     # Timestamps
     order_effective_time = transaction_time  # Use transaction time as effective time
 
-    # Route
-    route_code = "OTH"  # Set default, 'others'
-    for k, v in NAME_TO_PRESCRIPTION_ROUTE.items():
-        for value in v:
-            if value in drug_name:
-                route_code = k
-                break
-        if route_code != "OTH":
-            break
+    # Route & dose form (memoized per drug name)
+    route_code, dosage_form_code, dose_unit_code, dispense_unit_code = _classify_drug(
+        drug_name
+    )
 
     # Repeat pattern
     if route_code in ROUTE_TO_PRESC_REPEST_PATTERNS:
         random_repeat_all_sets = ROUTE_TO_PRESC_REPEST_PATTERNS[route_code]
-        random_repeat_set = random.choice(random_repeat_all_sets)
-        repeat_pattern_code = random_repeat_set["repeat_pattern_code"]
-        repeat_pattern_name = random_repeat_set["repeat_pattern_name"]
-        repeat_pattern_code_system = random_repeat_set["repeat_pattern_code_system"]
-        daily_dose = int(random_repeat_set["daily_dose"])
+        random_repeat_set = choice(random_repeat_all_sets)
+        repeat_pattern_code = random_repeat_set.repeat_pattern_code
+        repeat_pattern_name = random_repeat_set.repeat_pattern_name
+        repeat_pattern_code_system = random_repeat_set.repeat_pattern_code_system
+        daily_dose = int(random_repeat_set.daily_dose)
         # NOTE: daily_dose x minimum_dose = total_daily_dose
     else:
         # If no repeat pattern is found, use default values
@@ -575,56 +780,28 @@ def generate_random_prescription_order(
         repeat_pattern_code_system = "99xyz"  # Default repeat pattern code system
         daily_dose = 1
 
-    # Dose form & dose unit & dispense unit
-    dosage_form_code = ""  # Set default (null)
-    dose_unit_code = "DOSE"  # Set default first (~回分)
-    dispense_unit_code = "DOSE"  # Also set default first (~回分)
-    for k, v in NAME_TO_DOSE_FORM.items():
-        kws = v["keywords"]
-        for kw in kws:
-            if kw in drug_name:
-                dosage_form_code = k
-                dose_unit_code = v["dose_unit_code"]
-                dispense_unit_code = v["dispense_unit_code"]
-                break
-        if dosage_form_code != "":
-            break
+    # Duration in days:
+    duration_in_days = choice(
+        _ADMITTED_DURATIONS if is_admitted else _OUTPATIENT_DURATIONS
+    )
 
-    # Minimum dose
+    # Minimum dose, dispense amount and total daily dose
     # NOTE: If the minimum dose is hard to define, set it to '""' (double quotes).
-    if dose_unit_code == '""':
+    # The dose arithmetic stays on ints; strings are built once at the end.
+    if dose_unit_code == _NULL_DOSE:
         # For drug forms like ointment etc.
-        minimum_dose = (
-            '""'  # <- Note: This is not empty string, but '""' (double quotes)
-        )
+        minimum_dose = _NULL_DOSE  # <- Note: This is not empty string, but '""'
+        dispense_amount = str(randint(1, 5))  # e.g., 1本, 3個, etc.
+        total_daily_dose = ""  # Simply, empty
     else:
         # Minimum_dose ≒ quantity per dose
-        minimum_dose = str(random.randint(1, 3))  # Random 1 ~ 3
-
-    # Duration in days:
-    if is_admitted:
-        # Admission
-        duration_in_days = str(random.randint(1, 7))
-    else:
-        # Outpatient
-        duration_in_days = random.choice(["7", "30", "60", "90"])
-
-    # Dispense amount
-    if minimum_dose == '""':
-        # e.g., 1本, 3個, etc.
-        dispense_amount = str(random.randint(1, 5))
-    else:
+        minimum_dose_int = randint(1, 3)  # Random 1 ~ 3
+        minimum_dose = str(minimum_dose_int)
+        daily_total = minimum_dose_int * daily_dose  # e.g., 1回2錠 x 1日3回 = 6錠
         dispense_amount = str(
-            int(minimum_dose) * daily_dose * int(duration_in_days)
+            daily_total * int(duration_in_days)
         )  # e.g., 1回2錠 x 1日3回 x 7日分 = 42錠
-
-    # Total daily dose
-    if minimum_dose != '""':
-        total_daily_dose = str(
-            int(minimum_dose) * daily_dose
-        )  # e.g., 1回2錠 x 1日3回 = 6錠
-    else:
-        total_daily_dose = ""  # Simply, empty
+        total_daily_dose = str(daily_total)
 
     # Total occurence　(総合の処方回数、例えば疼痛時 10回分などでは10)
     if dose_unit_code == "DOSE":
@@ -674,80 +851,25 @@ def generate_random_injection_component(
     """
     Generates a random injection component for testing purposes.
     """
-    # Component type
-    # TODO: Add more keywords if needed.
-    base_kws = [
-        "生食",
-        "生理食塩",
-        "ブドウ糖液",
-        "ブドウ糖注射液",
-        "ブドウ糖注",
-        "注射用水",
-        "蒸留水",
-        "ソリタ",
-        "ラクトリンゲル",
-        "ソリューゲン",
-        "ビカネイト",
-        "リプラス",
-        "NK",
-        "EL",
-        "マルトス",
-        "キリット",
-        "糖液",
-        "糖注",
-        "リンゲル",
-        "ハルトマン",
-        "ニソリ",
-        "ヴィーン",
-        "アクメイン",
-        "ペロール",
-        "ビカーボン",
-        "ボルベン",
-        "デキストラン",
-        "デノサリン",
-        "ソルデム",
-        "ラクテック",
-        "ソルアセト",
-        "ソルラクト",
-        "フィジオ",
-        "ビーフリード",
-        "エルネオパ",
-        "ハイカリック",
-    ]
-    for kw in base_kws:
-        if kw in component_name:
-            component_type = "B"  # base
-            break
+    # Component type ("B" = base, "A" = additive)
+    if any(kw in component_name for kw in _INJECTION_BASE_KEYWORDS):
+        component_type = "B"  # base
     else:
         component_type = "A"  # additive
 
     # Infer component unit
     if component_type == "B":
-        quantity = random.choices(
-            ["100", "250", "500", "1000"],
-            weights=[
-                0.05,
-                0.05,
-                0.85,
-                0.05,
-            ],
-            k=1,
-        )[0]
-        component_unit_code = "ML"
+        quantity = _BASE_QUANTITIES[bisect_right(_BASE_QUANTITY_CUM, random.random())]
+        component_unit_code = _ML
     else:
         # Infer from name
         # TODO: Improve this logic if necessary.
-        match = re.search(r"(\d+(?:\.\d+)?)\s*(mg|g|μg)", component_name, re.IGNORECASE)
+        match = _COMPONENT_QUANTITY_RE.search(component_name)
         if match:
-            unit_map = {
-                "mg": "MG",
-                "g": "G",
-                "μg": "MCG",
-            }
             # For example, quantity is 25 and unit is mg. (25mg)
             quantity = match.group(1)  # <- Can be float like 2.5! Be careful!
             unit = match.group(2).lower()  # Normalize unit
-            component_unit_code = unit_map[unit]
+            component_unit_code = _COMPONENT_UNIT_MAP[unit]
         else:
             # Fallback to generic unit
             # NOTE: Currently, all fallbacks are set to "AMP" (アンプル).
@@ -761,10 +883,8 @@ def generate_random_injection_component(
         multiplier = 1
     else:
         # For additive components, we use random multiplier (25 mg x 3 = 75 mg/dose, etc)
-        multiplier = random.choices(
-            [1, 2, 3, 4, 5], weights=[50, 25, 12.5, 6.25, 6.25], k=1
-        )[
-            0
+        multiplier = _COMPONENT_MULTIPLIERS[
+            bisect_right(_COMPONENT_MULTIPLIER_CUM, random.random())
         ]  # Random multiplier for quantity
     if quantity.isdigit():
         # Process integer quantity
@@ -803,27 +923,24 @@ def generate_random_injection_order(
     """
     # Timestamps
     start_time_dt = to_datetime_anything(start_time)
-    end_time = (start_time_dt + timedelta(days=1)).strftime(BASE_TIMESTAMP_FORMAT)
+    end_time = format_base_timestamp(start_time_dt + timedelta(days=1))
     order_effective_time = transaction_time  # Use transaction time as effective time
 
     # Dispense
     # NOTE: This is computed from components. Improve this logic if necessary.
-    disp_water_volume = 0
-    for c in components:
-        if c.component_unit_code == "ML":
-            # Add water volume in mL
-            disp_water_volume += float(c.component_quantity)
-        else:
-            # Add constant
-            disp_water_volume += 10  # TODO: Change this if needed.
+    # Components in mL add their water volume; others add a constant 10.
+    disp_water_volume = sum(
+        float(c.component_quantity) if c.component_unit_code == _ML else 10
+        for c in components
+    )  # TODO: Change the constant if needed.
     dispense_amount = str(int(disp_water_volume))  # Total water volume to be dispensed
-    dispense_unit_code = "ML"  # From merit_9_4
+    dispense_unit_code = _ML  # From merit_9_4
     # Min dose (For OML-02, this is total water volume)
     # NOTE: Currently, we set minimum_dose to dispense_amount. Change this if needed.
     minimum_dose = dispense_amount
     dose_unit_code = dispense_unit_code
-    dose_unit_name = merit_9_4[dose_unit_code]
-    dose_unit_code_system = "MR9P"
+    dose_unit_name = _ML_NAME
+    dose_unit_code_system = _MR9P
 
     order = InjectionOrder(
         injection_type_code="00",  # TODO: We only use '00' (一般) for now. This is RXE-2 for OMP-02.
@@ -2,10 +2,25 @@ import random
 from faker import Faker
 from ..utils import normalize_and_validate_postal_code, generate_random_address, generate_random_phone
 
+# Shared Faker instance (ja_JP locale).
+# NOTE: Constructing Faker loads and initializes all provider modules, which is
+# far more expensive than generating the data itself. Build it once per process.
+_FAKE = Faker("ja_JP")
+
+# Prefectures the dummy hospital can be located in.
+_HOSPITAL_PREFECTURES = ("東京都", "埼玉県")
+
 
 class Hospital:
     """Hospital object to hold hospital information."""
 
+    __slots__ = (
+        "hospital_name",
+        "hospital_postal_code",
+        "hospital_address",
+        "hospital_phone",
+    )
+
     def __init__(
         self,
         hospital_name: str,
@@ -55,14 +70,12 @@ def generate_random_hospital() -> Hospital:
             - hospital_address
             - hospital_phone
     """
-    # Create a Faker instance
-    fake = Faker("ja_JP")  # Set the locale to Japanese (ja_JP)
     # Generate random hospital information
     # NOTE: We do not use fake.adress() to avoid including building names like 'パーク上野公園565'.
     hospital_name = "日本医療情報推進病院"  # Fixed hospital name for consistency
-    prefecture = random.choice(["東京都", "埼玉県"])
+    prefecture = random.choice(_HOSPITAL_PREFECTURES)
     hospital_address, hospital_postal_code = generate_random_address(
-        fake, prefecture=prefecture,
+        _FAKE, prefecture=prefecture,
         # Hospital addresses do not have building names
         add_building_name=False
     )
@@ -2,11 +2,31 @@
 Objects for lab test resukts.
 """
 
+import sys
+import random
+from collections import Counter
+from datetime import datetime, timedelta
 from typing import Literal
 from .physician import Physician
 from ..tables import h7t_0038, h7t_0085, h7t_0125, jlac10_test_types, jlac10_specimens
-from ..utils import format_timestamp, generate_random_timedelta, to_datetime_anything
-from ..config import BASE_TIMESTAMP_FORMAT
+from ..utils import (
+    format_timestamp,
+    format_base_timestamp,
+    to_datetime_anything,
+)
+
+# Code-system and status literals assigned into every result/specimen.
+# Interned once so that bulk runs share a single string object
+# (smaller memory footprint, pointer-fast equality checks).
+_JC10 = sys.intern("JC10")
+_SC = sys.intern("SC")
+_CM = sys.intern("CM")
+
+# Key listings quoted in validation failure messages. Assert messages are
+# only evaluated on failure, but the listings are static, so build them once.
+_H7T_0125_KEYS = list(h7t_0125.keys())
+_H7T_0085_KEYS = list(h7t_0085.keys())
+_H7T_0038_KEYS = list(h7t_0038.keys())
 
 
 class LabResult:
@@ -14,6 +34,23 @@ class LabResult:
     This class represents a laboratory test result.
     """
 
+    # Results are created in bulk (several per specimen), so the fixed slot
+    # layout avoids a per-instance __dict__.
+    __slots__ = (
+        "value_type",
+        "observation_code",
+        "observation_name",
+        "observation_code_system",
+        "observation_sub_id",
+        "observation_value",
+        "observation_value_code",
+        "observation_value_system",
+        "unit",
+        "unit_code",
+        "unit_code_system",
+        "status",
+    )
+
     def __init__(
         self,
         value_type: str,  # h7t_0125
@@ -37,7 +74,7 @@ class LabResult:
         # Validate
         assert (
             value_type in h7t_0125
-        ), f"value_type must be one of {list(h7t_0125.keys())}, got '{value_type}'."
+        ), f"value_type must be one of {_H7T_0125_KEYS}, got '{value_type}'."
         assert observation_code != "", "observation_code must not be empty."
         assert (
             observation_code_system != ""
@@ -61,7 +98,7 @@ class LabResult:
         ), "unit, unit_code, and unit_code_system combined must be less than 240 characters."
         assert (
             status in h7t_0085
-        ), f"status must be one of {list(h7t_0085.keys())}, got '{status}'."
+        ), f"status must be one of {_H7T_0085_KEYS}, got '{status}'."
 
         # Set attributes
         self.value_type = value_type
@@ -83,6 +120,30 @@ class LabResultSpecimen:
     This class represents a specimen for laboratory test results.
     """
 
+    __slots__ = (
+        "specimen_id",
+        "specimen_code",
+        "specimen_name",
+        "specimen_code_system",
+        "sampled_time",
+        "test_type_code",
+        "test_type_name",
+        "test_type_code_system",
+        "sampling_finished_time",
+        "reported_time",
+        "parent_result",
+        "results",
+        "order_type",
+        "order_control",
+        "order_status",
+        "requester_order_number",
+        "filler_order_number",
+        "transaction_time",
+        "order_effective_time",
+        "enterer",
+        "requester",
+    )
+
     def __init__(
         self,
         specimen_id: str,
@@ -153,7 +214,8 @@ class LabResultSpecimen:
         assert (
             len(specimen_code) + len(specimen_name) + len(specimen_code_system) < 240
         ), "Combined length of specimen_code, specimen_name, and specimen_code_system must be less than 240 characters."
-        sampled_time = format_timestamp(sampled_time, format="YYYYMMDD[HH[MM[SS]]]")
+        # NOTE: sampled_time is reformatted once below (YYYYMMDD[HH[MM]]);
+        # reformatting it here as well would just parse the string twice.
         # OBR things
         assert test_type_code != "", "test_type_code must not be empty."
         assert test_type_name != "", "test_type_name must not be empty."
@@ -168,7 +230,7 @@ class LabResultSpecimen:
         # NOTE: ORC-5 (order status) is usually optional, but required for lab test results.
         assert (
             order_status in h7t_0038
-        ), f"order_status must be one of {list(h7t_0038.keys())}, got '{order_status}'."
+        ), f"order_status must be one of {_H7T_0038_KEYS}, got '{order_status}'."
         assert order_type in [
             "O",
             "I",
@@ -233,7 +295,7 @@ class LabResultSpecimen:
 
         # ORC fields below
         self.order_type = order_type
-        self.order_control = "SC"  # h7t_0119, always 'SC' for lab test results.
+        self.order_control = _SC  # h7t_0119, always 'SC' for lab test results.
         self.order_status = order_status
         self.requester_order_number = requester_order_number
         self.filler_order_number = filler_order_number
@@ -296,41 +358,42 @@ def generate_random_lab_result_specimen(
     """
     # Time
     sampling_finished_time = sampled_time  # For simplicity, we set the same time for sampled_time and sampling_finished_time.
-    sampled_time_dt = to_datetime_anything(sampled_time)
-    reported_time = (sampled_time_dt + generate_random_timedelta(30, 180)).strftime(
-        BASE_TIMESTAMP_FORMAT
+    # NOTE: Bulk generation passes 14-digit YYYYMMDDHHMMSS strings; parse those
+    # directly and keep to_datetime_anything's format sniffing for the rest.
+    if len(sampled_time) == 14 and sampled_time.isdigit():
+        sampled_time_dt = datetime.strptime(sampled_time, "%Y%m%d%H%M%S")
+    else:
+        sampled_time_dt = to_datetime_anything(sampled_time)
+    reported_time = format_base_timestamp(
+        sampled_time_dt + timedelta(seconds=random.randint(30 * 60, 180 * 60))
     )
     transaction_time = reported_time
-    order_effective_time = (
+    order_effective_time = format_base_timestamp(
         sampled_time_dt
-        - generate_random_timedelta(
-            10, 1440
+        - timedelta(
+            seconds=random.randint(10 * 60, 1440 * 60)
         )  # 30 minutes to 24 hours before sampled_time
-    ).strftime(BASE_TIMESTAMP_FORMAT)
+    )
     # Detect test type
-    first_letters = {}
-    for r in results:
-        first_letter = r.observation_code[0]
-        if first_letter not in first_letters:
-            first_letters[first_letter] = 1
-        else:
-            first_letters[first_letter] += 1
-    most_common_first_letter = max(first_letters, key=first_letters.get)
+    # NOTE: Ties keep the first letter encountered (most_common sorts stably).
+    most_common_first_letter = Counter(
+        r.observation_code[0] for r in results
+    ).most_common(1)[0][0]
 
     if most_common_first_letter in jlac10_test_types:
         test_type_code = most_common_first_letter
         test_type_name = jlac10_test_types[most_common_first_letter]
-        test_type_code_system = "JC10"
+        test_type_code_system = _JC10
     else:
         # If the first letter is not in JLAC10, we use a default value.
         test_type_code = "8"
         test_type_name = "その他の検体検査"
-        test_type_code_system = "JC10"
+        test_type_code_system = _JC10
 
     # Specimen name and code
     if specimen_code in jlac10_specimens:
         specimen_name = jlac10_specimens[specimen_code]
-        specimen_code_system = "JC10"
+        specimen_code_system = _JC10
     else:
         specimen_code_system = "99XYZ"  # Local code system
         specimen_name = "不明な検体"  # Default name for other specimens
@@ -348,7 +411,7 @@ def generate_random_lab_result_specimen(
         reported_time=reported_time,
         parent_result="",  # Not used
         results=results,
-        order_status="CM",  # CM only
+        order_status=_CM,  # CM only
         transaction_time=transaction_time,
         order_effective_time=order_effective_time,
         requester_order_number=requester_order_number,
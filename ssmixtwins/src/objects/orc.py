@@ -0,0 +1,100 @@
+"""
+Shared ORC-field validation.
+
+The ORC segment fields (order control, order numbers, order type, and the
+ordering physicians) are repeated by every order saved in the same file, so
+their validation is shared by the drug order classes and Problem instead of
+living in any one of them.
+"""
+
+from functools import lru_cache
+from .physician import Physician
+from ..tables import h7t_0119
+from ..utils import zfill_order_number
+
+
+@lru_cache(maxsize=256)
+def validate_shared_orc_fields(
+    order_control: str,
+    requester_order_number: str,
+    filler_order_number: str,
+    order_type: str,
+    enterer: Physician,
+    requester: Physician,
+) -> tuple[str, str]:
+    """Validates the ORC fields shared by all orders saved in the same file.
+
+    Orders in one file repeat the same order numbers, order control, and
+    physicians, so this part is memoized: the assertion cascade and the
+    zero-padding run once per unique combination instead of once per order.
+
+    Returns:
+        tuple[str, str]: Zero-padded requester_order_number and zero-padded
+            filler_order_number (or empty string).
+    """
+    assert order_type in (
+        "O",
+        "I",
+    ), f"order_type must be 'O' for outpatient or 'I' for inpatient, got '{order_type}'."
+    assert (
+        order_control in h7t_0119
+    ), "Invalid order_control. It is usually NW or CA. See h7t_0119."
+    assert (requester_order_number.isdigit()) and len(
+        requester_order_number
+    ) <= 15, f"requester_order_number must be a number shorter than 16 characters long, got '{requester_order_number}'."
+    if filler_order_number != "":
+        # NOTE: This part in PPR^ZD1 is ambiguous in the guideline. Assume it is 15-digit number.
+        assert (filler_order_number.isdigit()) and len(
+            filler_order_number
+        ) <= 16, f"filler_order_number must be a number shorter than 16 characters long, got '{filler_order_number}'."
+    # NOTE: These isinstance checks are assert statements on purpose: they are
+    #       memoized away for repeated orders in the same file, and running
+    #       Python with -O compiles them out entirely for trusted bulk runs.
+    assert isinstance(enterer, Physician), "enterer must be a Physician object."
+    assert isinstance(requester, Physician), "requester must be a Physician object."
+    return requester_order_number.zfill(15), zfill_order_number(filler_order_number)
+
+
+def validate_and_format_orc_fields(
+    recipe_number: str,
+    order_admin_number: str,
+    order_control: str,
+    requester_order_number: str,
+    filler_order_number: str,
+    order_type: str,
+    enterer: Physician,
+    requester: Physician,
+) -> tuple[str, str, str]:
+    """Validates the ORC fields shared by prescription and injection orders.
+
+    Both order classes used to run an identical assertion cascade on these
+    fields; it is factored out here so the checks exist in one place only.
+    The file-shared fields are delegated to the memoized helper above; only
+    the per-order recipe/admin numbers are checked on every call.
+
+    Returns:
+        tuple[str, str, str]: Zero-padded requester_order_number,
+            zero-padded filler_order_number (or empty string), and the
+            requester_group_number derived from them.
+    """
+    requester_order_number, filler_order_number = validate_shared_orc_fields(
+        order_control,
+        requester_order_number,
+        filler_order_number,
+        order_type,
+        enterer,
+        requester,
+    )
+    assert (
+        recipe_number.isdigit() and len(recipe_number) == 2
+    ), f"recipe_number must be a 2-digit number, got '{recipe_number}'."
+    assert (
+        order_admin_number.isdigit() and len(order_admin_number) == 3
+    ), f"order_admin_number must be a 3-digit number, got '{order_admin_number}'."
+    # Requester_group_number logics
+    # NOTE: This logic is defined for injection orders. This is not excplicitly defined for prescription orders.
+    #       However, the logic for prescription orders is unclear in the guideline. Therefore, we use the same logic as injection orders.
+    requester_group_number = (
+        f"{requester_order_number}_{recipe_number}_{order_admin_number}"
+    )
+    return requester_order_number, filler_order_number, requester_group_number
@@ -1,24 +1,63 @@
 import re
+from bisect import bisect_right
 from datetime import timedelta
 from typing import Literal
 import random
 from faker import Faker
-import numpy as np
 from ..random_data import RANDOM_ABO_BLOOD_TYPES, RANDOM_ALLERGIES
 from ..utils import (
     format_timestamp,
+    format_base_timestamp,
     normalize_and_validate_postal_code,
     to_datetime_anything,
     generate_random_address,
     generate_random_phone,
 )
 from ..tables import udt_0001, jhsd_0001, jhsd_0001_ext, jhsd_0002, udt_0063, udt_0127
-from ..config import BASE_TIMESTAMP_FORMAT
+
+# Shared Faker instance (ja_JP locale).
+# NOTE: Constructing Faker loads and initializes all provider modules, which is
+# far more expensive than generating the data itself. Build it once per process.
+_FAKE = Faker("ja_JP")
+
+# Patient ID pattern, compiled once for the hot Patient construction path.
+_PATIENT_ID_RE = re.compile(r"^\w{6,250}$")
+
+# Key pools drawn from per insurance; built once instead of per call.
+_JHSD_0001_EXT_KEYS = tuple(jhsd_0001_ext.keys())
+_JHSD_0002_KEYS = tuple(jhsd_0002.keys())
+
+# Insurance classifications that carry a company name (PID-? insurer field).
+_COMPANY_NAMED_CLASSES = frozenset({"MI", "PE", "TI", "PS", "PI", "OE", "OT"})
+
+# Valid blood type values.
+_VALID_ABO = frozenset({"A", "B", "AB", "O"})
+_VALID_RH = frozenset({"+", "-"})
+
+# Insurance plan validity period (effective date + one year).
+_ONE_YEAR = timedelta(days=365)
+
+# Prefectures neighbouring Tokyo, for patient addresses.
+_NEARBY_PREFECTURES = ("埼玉県", "神奈川県", "千葉県", "茨城県", "栃木県", "群馬県", "山梨県")
+
+# Employment probability by age band: <16, 16-23, 24-64, 65+.
+# Indexed with bisect_right over the band boundaries.
+_WORKING_AGE_BOUNDS = (16, 24, 65)
+_WORKING_PROBS = (0.0, 0.5, 0.8, 0.4)
 
 
 class Allergy:
     """Allergy object for SSMIX dummy data generation."""
 
+    # These objects are created in bulk, so the fixed slot layout avoids a
+    # per-instance __dict__.
+    __slots__ = (
+        "allergy_type_code",
+        "allergen_code",
+        "allergen_name",
+        "allergen_code_system",
+    )
+
     def __init__(
         self,
         allergy_type_code: str,
@@ -52,6 +91,18 @@ class Allergy:
 class Insurance:
     """Insurance object for SSMIX dummy data generation."""
 
+    __slots__ = (
+        "insurance_plan_code",
+        "insurance_number",
+        "insurance_plan_effective_date",
+        "insurance_plan_expiration_date",
+        "insurance_plan_type",
+        "insurance_relationship",
+        "insurance_classification",
+        "insurance_class_name",
+        "insurance_company_name",
+    )
+
     def __init__(
         self,
         insurance_plan_code: str,
@@ -93,13 +144,14 @@ class Insurance:
             assert (
                 first_two in jhsd_0001_ext
             ), f"insurance_plan_code must start with one of {list(jhsd_0001_ext.keys())}, got '{insurance_plan_code}'."
-        insurance_classification = jhsd_0001[insurance_plan_code]["classification"]
-        insurance_class_name = jhsd_0001[insurance_plan_code]["name"]
+        insurance_plan_row = jhsd_0001[insurance_plan_code]
+        insurance_classification = insurance_plan_row["classification"]
+        insurance_class_name = insurance_plan_row["name"]
         if insurance_classification == "PE":
             assert (insurance_plan_type != "") and (
                 insurance_plan_type in jhsd_0002
             ), "insurance_plan_type must be provided for public expense insurance (PE) and must be one of jhsd_0002."
-        if insurance_classification in ["MI", "PE", "TI", "PS", "PI", "OE", "OT"]:
+        if insurance_classification in _COMPANY_NAMED_CLASSES:
             assert (
                 insurance_company_name != ""
             ), "insurance_company_name must not be empty for insurance plans MI, PE, TI, PS, PI, OE, OT."
@@ -129,6 +181,29 @@ class Insurance:
 class Patient:
     """Patient object for SSMIX dummy data generation."""
 
+    __slots__ = (
+        "patient_id",
+        "dob",
+        "sex",
+        "patient_first_name",
+        "patient_first_name_kana",
+        "patient_first_name_roman",
+        "patient_last_name",
+        "patient_last_name_kana",
+        "patient_last_name_roman",
+        "patient_postal_code",
+        "patient_address",
+        "home_phone",
+        "work_place",
+        "work_phone",
+        "abo_blood_type",
+        "rh_blood_type",
+        "height",
+        "weight",
+        "allergies",
+        "insurances",
+    )
+
     def __init__(
         self,
         patient_id: str,
@@ -178,8 +253,8 @@ class Patient:
         """
 
         # Validate and clean the inputs
-        assert re.match(
-            r"^\w{6,250}$", patient_id
+        assert _PATIENT_ID_RE.match(
+            patient_id
         ), "patient_id must be alphanumeric and 6-250 characters long."
         assert sex in udt_0001, "Invalid patient sex."
         assert (
@@ -200,17 +275,13 @@ class Patient:
         assert len(work_phone) <= 250, "work_phone must be 250 characters or less."
         assert len(work_place) <= 250, "work_place must be 250 characters or less."
         if abo_blood_type != "":
-            assert abo_blood_type in [
-                "A",
-                "B",
-                "AB",
-                "O",
-            ], "abo_blood_type must be one of 'A', 'B', 'AB', 'O', or empty."
+            assert (
+                abo_blood_type in _VALID_ABO
+            ), "abo_blood_type must be one of 'A', 'B', 'AB', 'O', or empty."
         if rh_blood_type != "":
-            assert rh_blood_type in [
-                "+",
-                "-",
-            ], "rh_blood_type must be one of '+', '-', or empty."
+            assert (
+                rh_blood_type in _VALID_RH
+            ), "rh_blood_type must be one of '+', '-', or empty."
         if height != "":
             try:
                 height_float = float(height)
@@ -227,14 +298,12 @@ class Patient:
                 ), "weight must be a digit between 1 and 500 kg."
             except ValueError as e:
                 raise ValueError(f"Weight must be a number, but got '{weight}'.") from e
-        if len(allergies) > 0:
+        # NOTE: Iterating directly covers the empty case; a separate list
+        # isinstance check added nothing that len()/iteration do not enforce.
+        for allergy in allergies:
             assert isinstance(
-                allergies, list
-            ), "allergies must be a list of Allergy objects."
-            for allergy in allergies:
-                assert isinstance(
-                    allergy, Allergy
-                ), "allergies must contain Allergy objects."
+                allergy, Allergy
+            ), "allergies must contain Allergy objects."
 
         # Format
         dob = format_timestamp(dob, "YYYYMMDD", allow_null=False)
@@ -279,11 +348,11 @@ def generate_random_allergies(
             - 'allergen_code_system': The code system for the allergen.
     """
     # Determine the number of allergies to generate
-    n_allergy = np.random.choice(n_allergy_list, p=weitghs)
-    # Draw random allergies from the RANDOM_ALLERGIES
+    # NOTE: stdlib choices beats np.random.choice for a single scalar draw.
+    n_allergy = random.choices(n_allergy_list, weights=weitghs, k=1)[0]
+    # Draw random allergies from the RANDOM_ALLERGIES (one call, with replacement)
     allergies = []
-    for _ in range(n_allergy):
-        allergy = random.choice(RANDOM_ALLERGIES)
+    for allergy in random.choices(RANDOM_ALLERGIES, k=n_allergy):
         allergies.append(
             Allergy(
                 allergy_type_code=allergy["allergy_type_code"],
@@ -305,52 +374,54 @@ def generate_random_insurances(
     Returns:
         Insurance: An Insurance object with randomly generated attributes.
     """
+    # Pre-bind RNG methods as locals (skips the module attribute lookup per call)
+    rand = random.random
+    choice = random.choice
+    randrange = random.randrange
+
     # === Insurance details ===
     # Convert current_date to datetime object
     current_date = to_datetime_anything(current_date)
 
     # Insurance plan code
     insurance_relationship = "SEL"  # Patient themselves is set always
-    if random.random() < 0.50:
+    if rand() < 0.50:
         insurance_plan_code = "C0"  # 50% C0, 国民健康保険 (National Health Insurance)
     else:
         # Otherwise, we choose from 法別番号 (stored in jhsd_0001_ext)
-        insurance_plan_code = random.choice(list(jhsd_0001_ext.keys()))
+        insurance_plan_code = choice(_JHSD_0001_EXT_KEYS)
 
     # 国民健康保険
     if insurance_plan_code == "C0":
         # 国民健康保険 does not have the first 2 digits of the insurance number
         insurance_number = str(
-            random.randint(100000, 999999)
+            randrange(100000, 1000000)
         )  # Random 6-digit insurance number
     # Other insurance plans
     else:
         # For other insurance plans, 8-digit insurance number is used
-        first_two = insurance_plan_code  # First two is the insurance plan code, if you use 法別番号
-        last_six = str(random.randint(100000, 999999))
-        insurance_number = f"{first_two}{last_six}"  # 8-digit insurance
+        # (the first two digits are the insurance plan code, 法別番号)
+        insurance_number = f"{insurance_plan_code}{randrange(100000, 1000000)}"
     # Insurance classification, name are obtained from jhsd_0001
     insurance_classification = jhsd_0001[insurance_plan_code]["classification"]
     # Insurance plan type
     if insurance_classification == "PE":
         # NOTE: insurance_plan_type is currently random, therefore it may be inconsistent with patient address.
-        insurance_plan_type = random.choice(list(jhsd_0002.keys()))
+        insurance_plan_type = choice(_JHSD_0002_KEYS)
     else:
         insurance_plan_type = ""  # Not applicable for other insurance plans
     # Insurance company name
-    if insurance_classification in ["MI", "PE", "TI", "PS", "PI", "OE", "OT"]:
+    if insurance_classification in _COMPANY_NAMED_CLASSES:
         # NOTE: Currently, we use a fixed value for this value, for simplicity.
         insurance_company_name = "保険者の名称(仮)"
     else:
         insurance_company_name = ""
 
     # Insurance plan effective and expiration dates
-    insurance_plan_effective_date = current_date.strftime(
-        BASE_TIMESTAMP_FORMAT
-    )  # Current date
-    insurance_plan_expiration_date = (current_date + timedelta(days=365 * 1)).strftime(
-        BASE_TIMESTAMP_FORMAT
-    )  # 1 years later
+    insurance_plan_effective_date = format_base_timestamp(current_date)  # Current date
+    insurance_plan_expiration_date = format_base_timestamp(
+        current_date + _ONE_YEAR
+    )  # 1 year later
 
     # Create an Insurance object
     insurance = Insurance(
@@ -389,14 +460,15 @@ def generate_random_patient(
     # Timestamp and dob
     age = int(age)  # Convert age to integer
 
-    # Create a Faker instance
-    fake = Faker("ja_JP")  # Set the locale to Japanese (ja_JP)
+    # Pre-bind RNG methods as locals (skips the module attribute lookup per call)
+    rand = random.random
+
     # Name
-    last_name_pair = fake.last_name_pair()
+    last_name_pair = _FAKE.last_name_pair()
     if sex == "F":
-        first_name_pair = fake.first_name_female_pair()
+        first_name_pair = _FAKE.first_name_female_pair()
     else:
-        first_name_pair = fake.first_name_male_pair()
+        first_name_pair = _FAKE.first_name_male_pair()
     patient_first_name = first_name_pair[0]
     patient_first_name_kana = first_name_pair[1]
     patient_first_name_roman = first_name_pair[2]
@@ -407,44 +479,41 @@ def generate_random_patient(
     patient_last_name_kana = f"カリ{patient_last_name_kana}"  # Add a prefix
 
     # Address
-    if random.random() < 0.5:
+    # NOTE: One uniform draw covers the 50/25/25 split that two chained
+    # rand() < 0.5 checks produced before.
+    prefecture_draw = rand()
+    if prefecture_draw < 0.5:
         # 50% Tokyo, because the hospital is located near Tokyo (See random hospital)
         prefecture = "東京都"  # Fixed
-    elif random.random() < 0.5:
+    elif prefecture_draw < 0.75:
         # 25% chance prefecture is from the list
-        prefecture = random.choice(
-            ["埼玉県", "神奈川県", "千葉県", "茨城県", "栃木県", "群馬県", "山梨県"]
-        )
+        prefecture = random.choice(_NEARBY_PREFECTURES)
     else:
         # Otherwise random
         prefecture = None
     patient_address, patient_postal_code = generate_random_address(
-        fake,
+        _FAKE,
         # Use a selected one or random
         prefecture=prefecture,
         # 50% chance of adding building name
-        add_building_name=random.random() < 0.5,
+        add_building_name=rand() < 0.5,
     )
     # Phone numbers
     home_phone = generate_random_phone(prefix="099")
     # Work place
-    if age < 16:
-        is_working = False
-    elif age >= 16 and age < 24:
-        is_working = random.random() < 0.5  # 50% chance
-    elif age >= 24 and age < 65:
-        is_working = random.random() < 0.8  # 90% chance
-    else:  # age >= 65
-        is_working = random.random() < 0.4  # 40% chance
+    # NOTE: The probability comes from the age-band table; the p > 0 guard keeps
+    # minors from consuming an RNG draw, as before.
+    working_prob = _WORKING_PROBS[bisect_right(_WORKING_AGE_BOUNDS, age)]
+    is_working = working_prob > 0.0 and rand() < working_prob
     if is_working:
-        work_place = fake.company()
+        work_place = _FAKE.company()
         work_phone = generate_random_phone(prefix="099")
     else:
         work_place = ""
         work_phone = ""
 
     # === Observations ===
-    rh_blood_type = "+" if random.random() < 0.995 else "-"  # 99.5% chance of Rh+
+    rh_blood_type = "+" if rand() < 0.995 else "-"  # 99.5% chance of Rh+
     abo_blood_type = random.choices(
         RANDOM_ABO_BLOOD_TYPES["choices"],
         weights=RANDOM_ABO_BLOOD_TYPES["weights"],
@@ -453,13 +522,14 @@ def generate_random_patient(
         0
     ]  # Randomly select ABO blood type based on weights
     # TODO: Add height and weight generation logic
-    height = np.random.normal(
-        loc=172,  # Average height in cm
-        scale=6,  # Standard deviation in cm
+    # NOTE: random.gauss avoids numpy's per-scalar dispatch overhead here.
+    height = random.gauss(
+        172,  # Average height in cm
+        6,  # Standard deviation in cm
     )
-    weight = np.random.normal(
-        loc=60,  # Average weight in kg
-        scale=10,  # Standard deviation in kg
+    weight = random.gauss(
+        60,  # Average weight in kg
+        10,  # Standard deviation in kg
     )
     height = f"{height:.1f}"
     weight = f"{weight:.1f}"
@@ -3,10 +3,29 @@ from faker import Faker
 from ..tables import udt_0069
 from ..random_data import RANDOM_DEPARTMENT_CODES
 
+# Shared Faker instance (ja_JP locale).
+# NOTE: Constructing Faker loads and initializes all provider modules, which is
+# far more expensive than generating the data itself. Build it once per process.
+_FAKE = Faker("ja_JP")
+
+# Department codes drawn from per physician; built once instead of per call.
+_DEPARTMENT_CODE_KEYS = tuple(RANDOM_DEPARTMENT_CODES.keys())
+
 
 class Physician:
     """Physician object to hold physician information."""
 
+    __slots__ = (
+        "physician_id",
+        "physician_first_name",
+        "physician_first_name_kana",
+        "physician_first_name_roman",
+        "physician_last_name",
+        "physician_last_name_kana",
+        "physician_last_name_roman",
+        "department_code",
+    )
+
     def __init__(
         self,
         physician_id: str,
@@ -65,11 +84,9 @@ def generate_random_physician() -> Physician:
     Returns:
         Physician: A Physician object.
     """
-    # Create a Faker instance
-    fake = Faker("ja_JP")  # Set the locale to Japanese (ja_JP)
     # Generate random physician information
-    first_name_pair = fake.first_name_pair()
-    last_name_pair = fake.last_name_pair()
+    first_name_pair = _FAKE.first_name_pair()
+    last_name_pair = _FAKE.last_name_pair()
     physician_first_name = first_name_pair[0]
     physician_first_name_kana = first_name_pair[1]
     physician_first_name_roman = first_name_pair[2]
@@ -85,7 +102,7 @@ def generate_random_physician() -> Physician:
         random.randint(1000000000, 9999999999)
     )  # Random 10-digit physician ID
     departmetn_code = random.choice(
-        list(RANDOM_DEPARTMENT_CODES.keys())
+        _DEPARTMENT_CODE_KEYS
     )  # Random department code from udt_0069
 
     # Return the physician attributes
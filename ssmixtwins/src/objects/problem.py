@@ -3,14 +3,54 @@ This object is for PPR^ZD1 message only.
 """
 
 import random
+from datetime import datetime
 from typing import Literal
 from .physician import Physician
-from ..tables import jhsd_0004, h7t_0119
-from ..utils import format_timestamp, to_datetime_anything, generate_random_timedelta
-from ..config import BASE_TIMESTAMP_FORMAT
+from .orc import validate_shared_orc_fields
+from ..tables import jhsd_0004
+from ..utils import (
+    combined_length_below,
+    format_timestamp,
+    format_base_timestamp,
+    to_datetime_anything,
+    generate_random_timedelta,
+)
+
+# Valid PRB-1 action codes.
+_ACTION_CODES = frozenset({"AD", "CD", "DE", "LI", "UC", "UN", "UP"})
+# Key listing for assert messages, built once instead of per failure.
+_JHSD_0004_KEYS = tuple(jhsd_0004.keys())
+# Diagnosis types drawn for random problems (入院時/外来時 or 最終).
+_ADMITTED_DX_TYPES = ("H", "F")
+_OUTPATIENT_DX_TYPES = ("O", "F")
 
 
 class Problem:
+    __slots__ = (
+        "action_code",
+        "action_time",
+        "dx_code",
+        "dx_name",
+        "dx_code_system",
+        "prb_instance_id",
+        "date_of_diagnosis",
+        "expected_time_solved",
+        "time_solved",
+        "time_of_onset",
+        "transaction_time",
+        "order_effective_time",
+        "icd10_code",
+        "icd10_name",
+        "diagnosis_type",
+        "provisional",
+        "order_type",
+        "order_control",
+        "requester_order_number",
+        "filler_order_number",
+        "enterer",
+        "requester",
+    )
+
     def __init__(
         self,
         action_code: str,  # Nonnull
@@ -76,17 +116,11 @@ class Problem:
             requester (Physician): The physician who requested the order.
         """
         # Validate and clean args
-        assert action_code in [
-            "AD",
-            "CD",
-            "DE",
-            "LI",
-            "UC",
-            "UN",
-            "UP",
-        ], f"Invalid action_code: {action_code}. Must be one of ['AD', 'CD', 'DE', 'LI', 'UC', 'UN', 'UP']."
         assert (
-            len(dx_code) + len(dx_name) + len(dx_code_system) < 230
+            action_code in _ACTION_CODES
+        ), f"Invalid action_code: {action_code}. Must be one of {sorted(_ACTION_CODES)}."
+        assert combined_length_below(
+            230, dx_code, dx_name, dx_code_system
         ), "dx_code, dx_name, and dx_code_system combined must be less than 230 characters."
         assert (
             dx_code != "" and dx_code_system != ""
@@ -94,8 +128,8 @@ class Problem:
         if icd10_code != "":
             # Loose validation for ICD-10 code
             assert len(icd10_code) <= 10, f"icd10 code is too long: {icd10_code}."
-        assert (
-            len(icd10_code) + len(icd10_name) + len(diagnosis_type) < 220
+        assert combined_length_below(
+            220, icd10_code, icd10_name, diagnosis_type
         ), "icd10_code, icd10_name, and diagnosis_type combined should be less than 220 characters."
         assert prb_instance_id != "", "prb_instance_id must not be empty."
         assert (
@@ -104,32 +138,24 @@ class Problem:
         if diagnosis_type != "":
             assert (
                 diagnosis_type in jhsd_0004
-            ), f"Invalid diagnosis_type: {diagnosis_type}. Must be one of {list(jhsd_0004.keys())}."
+            ), f"Invalid diagnosis_type: {diagnosis_type}. Must be one of {_JHSD_0004_KEYS}."
         if provisional != "":
             assert (
                 provisional == "1"
             ), f"provisional must be '1' or empty string, got '{provisional}'."
-        assert order_type in [
-            "O",
-            "I",
-        ], f"order_type must be 'O' for outpatient or 'I' for inpatient, got '{order_type}'."
-        assert (
-            order_control in h7t_0119
-        ), "Invalid order_control. It is usually NW or CA. See h7t_0119."
-        assert (requester_order_number.isdigit()) and len(
-            requester_order_number
-        ) <= 15, f"requester_order_number must be a number shorter than 16 characters long, got '{requester_order_number}'."
-        if filler_order_number != "":
-            # NOTE: This part in PPR^ZD1 is ambiguous in the guideline. Assume it is 15-digit number.
-            assert (filler_order_number.isdigit()) and len(
-                filler_order_number
-            ) <= 16, f"filler_order_number must be a number shorter than 16 characters long, got '{filler_order_number}'."
+        # Shared ORC fields
+        # NOTE: Problems saved in the same file repeat the same ORC fields, so
+        #       their validation and zero-padding are memoized in the shared
+        #       helper — they run once per unique combination, not per problem.
         # NOTE: ORC-4 is currently not implemented in PPR^ZD1, because it is unclear in the guideline.
-
-        # Format numbers
-        requester_order_number = requester_order_number.zfill(15)
-        if filler_order_number != "":
-            filler_order_number = filler_order_number.zfill(15)
+        requester_order_number, filler_order_number = validate_shared_orc_fields(
+            order_control,
+            requester_order_number,
+            filler_order_number,
+            order_type,
+            enterer,
+            requester,
+        )
 
         # Timestamps
         # Format time strings
@@ -199,12 +225,18 @@ def generate_random_problem(
     # Admission related fields
     if is_admitted:
         order_type = "I"
-        diagnosis_type = random.choice(["H", "F"])  # 入院時 or 最終
+        diagnosis_type = _ADMITTED_DX_TYPES[random.getrandbits(1)]  # 入院時 or 最終
     else:
         order_type = "O"
-        diagnosis_type = random.choice(["O", "F"])  # 外来時 or 最終
+        diagnosis_type = _OUTPATIENT_DX_TYPES[random.getrandbits(1)]  # 外来時 or 最終
     # Timestamps
-    action_time_dt = to_datetime_anything(action_time)
+    # Fast path: preprocessed action times are digit-only, full-length
+    # BASE_TIMESTAMP_FORMAT strings, so parse them directly and fall back to
+    # the tolerant converter only for irregular inputs.
+    if len(action_time) == 20 and action_time.isdigit():
+        action_time_dt = datetime.strptime(action_time, "%Y%m%d%H%M%S%f")
+    else:
+        action_time_dt = to_datetime_anything(action_time)
     date_of_diagnosis_dt = action_time_dt - generate_random_timedelta(0, 1440)
     time_of_onset_dt = action_time_dt - generate_random_timedelta(0, 1440 * 30)
     expected_time_solved_dt = action_time_dt + generate_random_timedelta(0, 1440 * 30)
@@ -216,21 +248,20 @@ def generate_random_problem(
         dx_name=dx_name,
         dx_code_system=dx_code_system,
         prb_instance_id=prb_instance_id,
-        date_of_diagnosis=date_of_diagnosis_dt.strftime(BASE_TIMESTAMP_FORMAT),
-        expected_time_solved=expected_time_solved_dt.strftime(BASE_TIMESTAMP_FORMAT),
+        date_of_diagnosis=format_base_timestamp(date_of_diagnosis_dt),
+        expected_time_solved=format_base_timestamp(expected_time_solved_dt),
         time_solved="",  # Currently, not used
         icd10_code=icd10_code,
         icd10_name=icd10_name,
         diagnosis_type=diagnosis_type,
         provisional=provisional,
-        time_of_onset=time_of_onset_dt.strftime(BASE_TIMESTAMP_FORMAT),
+        time_of_onset=format_base_timestamp(time_of_onset_dt),
         transaction_time=action_time,  # Transaction time = action time
         order_effective_time=action_time,  # Order effective time = action time
         order_control="NW",  # Always NW
-        requester_order_number=requester_order_number.zfill(15),
-        filler_order_number=(
-            filler_order_number.zfill(15) if filler_order_number else ""
-        ),
+        # NOTE: Problem.__init__ zero-pads both order numbers; no need to pad here.
+        requester_order_number=requester_order_number,
+        filler_order_number=filler_order_number,
         order_type=order_type,
         enterer=enterer,
         requester=requester,
@@ -2,6 +2,7 @@ import os
 import re
 import glob
 import uuid
+from collections import namedtuple
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from tqdm import tqdm
 import pandas as pd
@@ -43,6 +44,22 @@ PRESC_KEYWORDS = [
     "内服",
     "内用",
 ]
+# Compiled once so repeated per-file calls skip pandas' pattern re-compilation.
+_PRESC_KEYWORDS_RE = re.compile("|".join(PRESC_KEYWORDS))
+
+# Precompiled patterns for clean_drug_names()
+_RE_WHITESPACE = re.compile(r"\s+")
+_RE_UNWANTED_CHARS = re.compile(
+    r"(※|・|×|\*|＊|,|\"|＂|”|“||\'|＇|’|‘|′|-|−)"
+)
+_RE_BRACKETED = re.compile(
+    r"\[.*?\]|\(.*?\)|\{.*?\}|<.*?>|（.*?）|【.*?】|〈.*?〉|〔.*?〕|「.*?」|『.*?』"
+)
+_RE_UNITS = re.compile(
+    r"((\d+\.\d+|\d+)(\%|((m|μ|n|p)?g|(m|μ|)?(l|L)|(c|m)(m|M))|Eq|mEq|[一二三四五六七八九十百千万]*(((国際|国内)(標準)?)?単位|(I)?U)))|(/((\d+\.\d+|\d+))?((m|μ|n|p)?g|(m|μ|)?(l|L)|(c|m)(m|M)|包))|((\d+\.\d+|\d+))/((\d+\.\d+|\d+))"
+)
+_RE_TRAILING = re.compile(r"(\d+\.\d*|\d+|([一二三四五六七八九十百千万]+))$")
+_RE_KATAKANA = re.compile(r"[ァ-ヶー]+")
 
 
 def clean_drug_names(drug_names: pd.Series) -> pd.Series:
@@ -59,31 +76,19 @@ def clean_drug_names(drug_names: pd.Series) -> pd.Series:
     # Fill nan with empty strings for string operations
     cropped = drug_names.fillna("")
     # Remove white spaces from product names
-    cropped = cropped.str.replace(r"\s+", "", regex=True)
+    cropped = cropped.str.replace(_RE_WHITESPACE, "", regex=True)
     # Remove other unnecessary characters
-    cropped = cropped.str.replace(
-        r"(※|・|×|\*|＊|,|\"|＂|”|“||\'|＇|’|‘|′|-|−)", "", regex=True
-    )
+    cropped = cropped.str.replace(_RE_UNWANTED_CHARS, "", regex=True)
     # Remove bracketed parts (e.g, '(麻)', '「メーカー」 etc.) from product names
-    cropped = cropped.str.replace(
-        r"\[.*?\]|\(.*?\)|\{.*?\}|<.*?>|（.*?）|【.*?】|〈.*?〉|〔.*?〕|「.*?」|『.*?』",
-        "",
-        regex=True,
-    )
+    cropped = cropped.str.replace(_RE_BRACKETED, "", regex=True)
     # Remove common units from product names
-    cropped = cropped.str.replace(
-        r"((\d+\.\d+|\d+)(\%|((m|μ|n|p)?g|(m|μ|)?(l|L)|(c|m)(m|M))|Eq|mEq|[一二三四五六七八九十百千万]*(((国際|国内)(標準)?)?単位|(I)?U)))|(/((\d+\.\d+|\d+))?((m|μ|n|p)?g|(m|μ|)?(l|L)|(c|m)(m|M)|包))|((\d+\.\d+|\d+))/((\d+\.\d+|\d+))",
-        "",
-        regex=True,
-    )
+    cropped = cropped.str.replace(_RE_UNITS, "", regex=True)
     # Remove unnecessary trail characters
-    cropped = cropped.str.replace(
-        r"(\d+\.\d*|\d+|([一二三四五六七八九十百千万]+))$", "", regex=True
-    )
+    cropped = cropped.str.replace(_RE_TRAILING, "", regex=True)
 
     # Extract Katakana characters part as the proxy for drug names (most of the time, this is the drug name)
     def extract_longest_katakana(text):
-        matches = re.findall(r"[ァ-ヶー]+", text)
+        matches = _RE_KATAKANA.findall(text)
         return max(matches, key=len) if matches else None
 
     cropped = cropped.apply(extract_longest_katakana)
@@ -123,28 +128,167 @@ def map_codes(df: pd.DataFrame, src_col: str, dst_col: str, map: str) -> pd.Data
         pd.DataFrame: The original DataFrame with an additional column `dst_col` containing the mapped codes.
     """
     # Clean map
+    # NOTE: The shuffle is intentional and must stay per call: when a source
+    #       code has several candidates, each call draws a random one.
+    clean_map = map.sample(frac=1, replace=False).drop_duplicates(
+        subset=src_col
+    )  # Shuffle the map, then ensure one-to-one
+    # Add 'dst_col' ± 'text' col by dict lookup
+    # NOTE: A .map() over a plain dict replaces the previous left merge; it
+    #       avoids materializing a merged copy of the whole DataFrame (and the
+    #       index save/restore that came with it) on every call.
+    src = df[src_col]
+    df[dst_col] = src.map(dict(zip(clean_map[src_col], clean_map[dst_col]))).fillna("")
     if ("text" in map.columns) and (dst_col != "text"):
-        clean_map = map[[src_col, dst_col, "text"]].copy()
-    else:
-        clean_map = map[[src_col, dst_col]].copy()
-    clean_map = clean_map.sample(frac=1, replace=False).reset_index(
-        drop=True
-    )  # Shuffle the map
-    clean_map = clean_map.drop_duplicates(subset=src_col).reset_index(
-        drop=True
-    )  # Ensure on-to-one
-    # Add 'dst_col' ± 'text' col by merge
-    indexes = df.index.copy()
-    df = df.merge(clean_map, how="left", left_on=src_col, right_on=src_col, sort=False)
-    df.index = indexes  # Restore original index
-
-    # Fill NaN values in the destination column with empty strings
-    df[dst_col] = df[dst_col].fillna("")
-    if "text" in df:
-        df["text"] = df["text"].fillna("")  # Fill 'text' if exists
+        df["text"] = src.map(dict(zip(clean_map[src_col], clean_map["text"]))).fillna(
+            ""
+        )
     return df
 
 
+# Code maps preprocessed once per run instead of once per input file:
+# normalized texts plus the prescription/injection splits of the drug maps.
+_PreparedMaps = namedtuple(
+    "_PreparedMaps",
+    [
+        "icd10_to_mdcdx2_map",
+        "atc_to_yj_map",
+        "yj_to_hot_map",
+        "jlac10_segment_dicts",
+        "atc_yj_presc_map",
+        "atc_yj_injec_map",
+        "yj_hot_presc_map",
+        "yj_hot_injec_map",
+        "atc_hot_presc_map",
+        "atc_hot_injec_map",
+        "atc_hot_random_map",
+    ],
+)
+
+# Per-process holder for the prepared maps, set once by _init_worker().
+_WORKER_MAPS = None
+
+
+def _init_worker(prepared_maps: _PreparedMaps):
+    """Stores the prepared maps in a worker process (ProcessPoolExecutor initializer)."""
+    global _WORKER_MAPS
+    _WORKER_MAPS = prepared_maps
+
+
+def _prepare_maps(
+    icd10_to_mdcdx2_map: pd.DataFrame,
+    atc_to_yj_map: pd.DataFrame,
+    atc_to_hot_map: pd.DataFrame,
+    yj_to_hot_map: pd.DataFrame,
+    jlac10_segment_map: pd.DataFrame,
+) -> _PreparedMaps:
+    """Normalizes and splits the code maps shared by all input files.
+
+    The maps are identical for every file, so the text normalization and the
+    prescription/injection splitting used to be repeated inside each
+    clean_base_table call. This runs the whole precompute once; the result is
+    shipped to each worker process a single time via _init_worker.
+
+    Returns:
+        _PreparedMaps: The normalized maps and their presc/injec variants.
+    """
+    # Normalize texts
+    icd10_to_mdcdx2_map = icd10_to_mdcdx2_map.copy()
+    icd10_to_mdcdx2_map["text"] = (
+        icd10_to_mdcdx2_map["text"].str.strip().str.normalize("NFKC")
+    )
+    yj_to_hot_map = yj_to_hot_map.copy()
+    yj_to_hot_map["text"] = yj_to_hot_map["text"].str.strip().str.normalize("NFKC")
+    jlac10_segment_map = jlac10_segment_map.copy()
+    jlac10_segment_map["text"] = (
+        jlac10_segment_map["text"].str.strip().str.normalize("NFKC")
+    )
+    # Create maps for prescription and injection orders separately
+    atc_yj_presc_mask = atc_to_yj_map["text"].str.contains(
+        _PRESC_KEYWORDS_RE, regex=True
+    )
+    atc_yj_presc_map = atc_to_yj_map[atc_yj_presc_mask].rename(
+        columns={"yj": "yj_presc"}
+    )
+    atc_yj_injec_map = atc_to_yj_map[~atc_yj_presc_mask].rename(
+        columns={"yj": "yj_injec"}
+    )
+    yj_hot_presc_mask = yj_to_hot_map["text"].str.contains(
+        _PRESC_KEYWORDS_RE, regex=True
+    )
+    yj_hot_presc_map = yj_to_hot_map[yj_hot_presc_mask].rename(
+        columns={"yj": "yj_presc", "hot": "hot_presc"}
+    )
+    yj_hot_injec_map = yj_to_hot_map[~yj_hot_presc_mask].rename(
+        columns={"yj": "yj_injec", "hot": "hot_injec"}
+    )
+    atc_hot_presc_mask = atc_to_hot_map["text"].str.contains(
+        _PRESC_KEYWORDS_RE, regex=True
+    )
+    atc_hot_presc_map = atc_to_hot_map[atc_hot_presc_mask].rename(
+        columns={"hot": "hot_presc_sub"}
+    )
+    atc_hot_injec_map = atc_to_hot_map[~atc_hot_presc_mask].rename(
+        columns={"hot": "hot_injec_sub"}
+    )
+    atc_hot_random_map = atc_to_hot_map.rename(columns={"hot": "hot_sub"})
+    # Partition the JLAC10 segment map by segment kind, keyed by the meaningful
+    # (non-wildcard) substring of each 17-character key. _clean_lab then looks
+    # up sliced codes directly instead of rebuilding wildcard-padded keys and
+    # mapping the whole key six times per file.
+    # NOTE: Segment keys map one-to-one to texts, so plain dicts are safe here.
+    segment = jlac10_segment_map["segment"]
+    segment_text = jlac10_segment_map["text"]
+    starts_wild = segment.str.startswith("*")
+    ends_wild = segment.str.endswith("*")
+    # Detect each segment kind from its wildcard pattern
+    is_analyte = ~starts_wild & ends_wild  # code[0:5] + '*' * 12
+    is_identification = segment.str.startswith("*" * 5) & ~segment.str.startswith(
+        "*" * 9
+    )  # '*' * 5 + code[5:9] + '*' * 8
+    is_specimen = segment.str.startswith("*" * 9) & ~segment.str.startswith(
+        "*" * 12
+    )  # '*' * 9 + code[9:12] + '*' * 5
+    is_method = segment.str.startswith("*" * 12) & ~segment.str.startswith(
+        "*" * 15
+    )  # '*' * 12 + code[12:15] + '*' * 2
+    is_result_id = segment.str.startswith("*" * 15)  # '*' * 15 + code[15:17]
+    is_unique_result = ~starts_wild & ~ends_wild  # code[0:9] + '*' * 6 + code[15:17]
+
+    def _segment_dict(mask: pd.Series, start: int, stop: int) -> dict:
+        return dict(zip(segment[mask].str.slice(start, stop), segment_text[mask]))
+
+    jlac10_segment_dicts = {
+        "analyte": _segment_dict(is_analyte, 0, 5),
+        "identification": _segment_dict(is_identification, 5, 9),
+        "specimen": _segment_dict(is_specimen, 9, 12),
+        "method": _segment_dict(is_method, 12, 15),
+        "result_idenfitication": _segment_dict(is_result_id, 15, 17),
+        # The unique-result key combines two substrings
+        "unique_result_identification": dict(
+            zip(
+                segment[is_unique_result].str.slice(0, 9)
+                + segment[is_unique_result].str.slice(15, 17),
+                segment_text[is_unique_result],
+            )
+        ),
+    }
+
+    return _PreparedMaps(
+        icd10_to_mdcdx2_map=icd10_to_mdcdx2_map,
+        atc_to_yj_map=atc_to_yj_map,
+        yj_to_hot_map=yj_to_hot_map,
+        jlac10_segment_dicts=jlac10_segment_dicts,
+        atc_yj_presc_map=atc_yj_presc_map,
+        atc_yj_injec_map=atc_yj_injec_map,
+        yj_hot_presc_map=yj_hot_presc_map,
+        yj_hot_injec_map=yj_hot_injec_map,
+        atc_hot_presc_map=atc_hot_presc_map,
+        atc_hot_injec_map=atc_hot_injec_map,
+        atc_hot_random_map=atc_hot_random_map,
+    )
+
+
 def _clean_dx(df: pd.DataFrame, dx_type: int, icd10_to_mdcdx2_map: pd.DataFrame):
     # Map ICD10 -> MDCDX2 and texts
     dx_mask = df["type"] == dx_type
@@ -173,12 +317,10 @@ def _clean_dx(df: pd.DataFrame, dx_type: int, icd10_to_mdcdx2_map: pd.DataFrame)
         dx_table["mdcdx2"] = dx_table["mdcdx2"].fillna("")
         dx_table["text"] = dx_table["text"].fillna("")
         # Assign
-        df.loc[dx_mask, "icd10"] = dx_table["icd10"].copy()  # Add ICD10
-        df.loc[dx_mask, "mdcdx2"] = dx_table["mdcdx2"].copy()  # Add MDCDX2
-        df.loc[dx_mask, "text"] = dx_table["text"].copy()  # Add text for MDCDX2
-        df.loc[dx_mask, "provisional"] = dx_table[
-            "provisional"
-        ].copy()  # Add provisional
+        # NOTE: One multi-column write instead of four .loc scatter assignments;
+        #       each masked setitem re-aligns and copies blocks of the parent frame.
+        dx_cols = ["icd10", "mdcdx2", "text", "provisional"]
+        df.loc[dx_mask, dx_cols] = dx_table[dx_cols].to_numpy()
 
     return df
 
@@ -188,9 +330,7 @@ def _clean_drug_orders(
     med_type: int,  # 4
     presc_type: int,  # 4
     injec_type: int,  # 5
-    atc_to_yj_map: pd.DataFrame,  # Should have columns ['atc', 'yj']
-    yj_to_hot_map: pd.DataFrame,  # Should have columns ['yj', 'hot', 'text']
-    atc_to_hot_map: pd.DataFrame = None,  # Should have columns ['atc', 'hot', 'text']
+    maps: _PreparedMaps,  # Prepared drug code maps (see _prepare_maps)
 ) -> pd.DataFrame:
     # Map ATC
     med_mask = df["type"] == med_type
@@ -206,38 +346,18 @@ def _clean_drug_orders(
         med_table = med_table.drop(
             columns=["text"], errors="ignore"
         )  # Remove 'text' if exists
-        # Set patterns
-        presc_keywords_pattern = "|".join(PRESC_KEYWORDS)
-        # Create maps for prescription and injection orders separately
-        atc_yj_presc_mask = atc_to_yj_map["text"].str.contains(
-            presc_keywords_pattern, regex=True
-        )
-        atc_yj_injec_mask = ~atc_yj_presc_mask
-        atc_yj_presc_map = atc_to_yj_map[atc_yj_presc_mask].copy()
-        atc_yj_injec_map = atc_to_yj_map[atc_yj_injec_mask].copy()
-        atc_yj_presc_map = atc_yj_presc_map.rename(columns={"yj": "yj_presc"})
-        atc_yj_injec_map = atc_yj_injec_map.rename(columns={"yj": "yj_injec"})
-        yj_hot_presc_mask = yj_to_hot_map["text"].str.contains(
-            presc_keywords_pattern, regex=True
-        )
-        yj_hot_injec_mask = ~yj_hot_presc_mask
-        yj_hot_presc_map = yj_to_hot_map[yj_hot_presc_mask].copy()
-        yj_hot_injec_map = yj_to_hot_map[yj_hot_injec_mask].copy()
-        yj_hot_presc_map = yj_hot_presc_map.rename(
-            columns={"yj": "yj_presc", "hot": "hot_presc"}
-        )
-        yj_hot_injec_map = yj_hot_injec_map.rename(
-            columns={"yj": "yj_injec", "hot": "hot_injec"}
-        )
-        atc_hot_prsc_mask = atc_to_hot_map["text"].str.contains(
-            presc_keywords_pattern, regex=True
-        )
-        atc_hot_injec_mask = ~atc_hot_prsc_mask
-        atc_hot_presc_map = atc_to_hot_map[atc_hot_prsc_mask].copy()
-        atc_hot_injec_map = atc_to_hot_map[atc_hot_injec_mask].copy()
-        atc_hot_presc_map = atc_hot_presc_map.rename(columns={"hot": "hot_presc_sub"})
-        atc_hot_injec_map = atc_hot_injec_map.rename(columns={"hot": "hot_injec_sub"})
-        atc_to_hot_map = atc_to_hot_map.rename(columns={"hot": "hot_sub"})
+        # Unpack the prepared prescription/injection map variants
+        # NOTE: Splitting and renaming these maps is identical for every file,
+        #       so it is done once in _prepare_maps instead of per call.
+        atc_yj_presc_map = maps.atc_yj_presc_map
+        atc_yj_injec_map = maps.atc_yj_injec_map
+        atc_to_yj_map = maps.atc_to_yj_map
+        yj_hot_presc_map = maps.yj_hot_presc_map
+        yj_hot_injec_map = maps.yj_hot_injec_map
+        yj_to_hot_map = maps.yj_to_hot_map
+        atc_hot_presc_map = maps.atc_hot_presc_map
+        atc_hot_injec_map = maps.atc_hot_injec_map
+        atc_to_hot_map = maps.atc_hot_random_map
 
         # Map ATC -> YJ and texts
         # NOTE: This is redundant, but we need possible naming candidates both for prescriptions and injections.
@@ -327,23 +447,30 @@ def _clean_drug_orders(
 
         # --- Speparate prescriptions and injections ---
         # Set flags for prescriptions vs injections
-        med_table["is_injection"] = False
-        # Iterate through groups of the same timestamp
-        for _, group in med_table.groupby("timestamp"):
-            # No1. If many ordersare made, it is usually injections.
-            if len(group) >= INJEC_THRESHOLD:
-                med_table.loc[group.index, "is_injection"] = True
-            # No2. If ATC begins with 'B', it is usually injections.
-            elif group["atc"].str.startswith("B").any():
-                med_table.loc[group.index, "is_injection"] = True
-            # No3. Poll by randomly mapped drug names
-            n_votes_for_presc = (
-                group["text_random"]
-                .str.contains(presc_keywords_pattern, regex=True)
-                .sum()
-            )
-            if n_votes_for_presc < len(group) / 2:
-                med_table.loc[group.index, "is_injection"] = True
+        # NOTE: The three rules are evaluated per timestamp group, but with
+        #       whole-column booleans and groupby transforms instead of a
+        #       Python loop with per-group scatter writes into med_table.
+        timestamps = med_table["timestamp"]
+        group_size = timestamps.groupby(timestamps).transform("size")
+        # No1. If many orders are made, it is usually injections.
+        many_orders = group_size >= INJEC_THRESHOLD
+        # No2. If ATC begins with 'B', it is usually injections.
+        any_atc_b = (
+            med_table["atc"]
+            .str.startswith("B", na=False)
+            .groupby(timestamps)
+            .transform("any")
+        )
+        # No3. Poll by randomly mapped drug names
+        n_votes_for_presc = (
+            med_table["text_random"]
+            .str.contains(_PRESC_KEYWORDS_RE, regex=True)
+            .groupby(timestamps)
+            .transform("sum")
+        )
+        med_table["is_injection"] = (
+            many_orders | any_atc_b | (n_votes_for_presc < group_size / 2)
+        )
 
         # Set type
         med_table.loc[med_table["is_injection"], "type"] = injec_type
@@ -367,16 +494,16 @@ def _clean_drug_orders(
         med_table["atc"] = med_table["atc"].fillna("")
         med_table["text"] = med_table["text"].fillna("")
         # Assign
-        df.loc[med_mask, "atc"] = df.loc[med_mask, "code"].copy()
-        df.loc[med_mask, "yj"] = med_table["yj"].copy()
-        df.loc[med_mask, "hot"] = med_table["hot"].copy()
-        df.loc[med_mask, "text"] = med_table["text"].copy()
-        df.loc[med_mask, "type"] = med_table["type"].copy()  # Update type
+        # NOTE: String columns are written in one multi-column assignment;
+        #       'type' is assigned separately to keep its integer dtype intact.
+        med_cols = ["atc", "yj", "hot", "text"]
+        df.loc[med_mask, med_cols] = med_table[med_cols].to_numpy()
+        df.loc[med_mask, "type"] = med_table["type"]  # Update type
 
     return df
 
 
-def _clean_lab(df: pd.DataFrame, lab_type: int, jlac10_segment_map: pd.DataFrame):
+def _clean_lab(df: pd.DataFrame, lab_type: int, jlac10_segment_dicts: dict):
 
     # Clean lab
     lab_mask = df["type"] == lab_type
@@ -408,44 +535,35 @@ def _clean_lab(df: pd.DataFrame, lab_type: int, jlac10_segment_map: pd.DataFrame
             ""  # Remove 'no_unit' from unit
         )
 
-        # Segment code
-        lab_table["analyte"] = (
-            lab_table["code"].str.slice(0, 5) + "*" * 12
-        )  # Extract analyte code
-        lab_table["identification"] = (
-            "*" * 5 + lab_table["code"].str.slice(5, 9) + "*" * 8
-        )  # Extract identification code
-        lab_table["specimen"] = (
-            "*" * 9 + lab_table["code"].str.slice(9, 12) + "*" * 5
-        )  # Extract specimen code
-        lab_table["method"] = (
-            "*" * 12 + lab_table["code"].str.slice(12, 15) + "*" * 2
-        )  # Extract method code (分析物固有結果識別)
-        lab_table["result_idenfitication"] = "*" * 15 + lab_table["code"].str.slice(
-            15, 17
-        )  # Extract result identification code
-        lab_table["unique_result_identification"] = (
-            lab_table["code"].str.slice(0, 9)
-            + "*" * 6
-            + lab_table["code"].str.slice(15, 17)
-        )
-        # Map segments to text
-        lab_table = lab_table.drop(
-            "text", axis=1, errors="ignore"
-        )  # Remove 'text' if exists
-        for col in [
-            "analyte",
-            "identification",
-            "specimen",
-            "method",
-            "result_idenfitication",
-            "unique_result_identification",
-        ]:
-
-            lab_table = lab_table.rename(columns={col: "segment"})
-            lab_table = map_codes(lab_table, "segment", "text", jlac10_segment_map)
-            lab_table = lab_table.rename(columns={"text": col + "_text"})
-            lab_table = lab_table.drop(columns=["segment"])  # Drop the segment column
+        # Segment texts
+        # NOTE: Each segment text is looked up by the meaningful substring of
+        #       the JLAC10 code in the pre-partitioned dicts (see
+        #       _prepare_maps), instead of rebuilding wildcard-padded
+        #       17-character keys and mapping the whole segment map six times.
+        code = lab_table["code"]
+        lab_table["analyte_text"] = (
+            code.str.slice(0, 5).map(jlac10_segment_dicts["analyte"]).fillna("")
+        )
+        lab_table["identification_text"] = (
+            code.str.slice(5, 9).map(jlac10_segment_dicts["identification"]).fillna("")
+        )
+        lab_table["specimen_text"] = (
+            code.str.slice(9, 12).map(jlac10_segment_dicts["specimen"]).fillna("")
+        )
+        # Method code (分析物固有結果識別)
+        lab_table["method_text"] = (
+            code.str.slice(12, 15).map(jlac10_segment_dicts["method"]).fillna("")
+        )
+        lab_table["result_idenfitication_text"] = (
+            code.str.slice(15, 17)
+            .map(jlac10_segment_dicts["result_idenfitication"])
+            .fillna("")
+        )
+        lab_table["unique_result_identification_text"] = (
+            (code.str.slice(0, 9) + code.str.slice(15, 17))
+            .map(jlac10_segment_dicts["unique_result_identification"])
+            .fillna("")
+        )
         # Override result identification
         has_unique_result = lab_table["unique_result_identification_text"] != ""
         lab_table.loc[has_unique_result, "result_idenfitication_text"] = lab_table.loc[
@@ -465,14 +583,11 @@ def _clean_lab(df: pd.DataFrame, lab_type: int, jlac10_segment_map: pd.DataFrame
         lab_table["lab_value"] = lab_table["lab_value"].fillna("")
         lab_table["code"] = lab_table["code"].fillna("")  # Fill code
         # Assign
-        df.loc[lab_mask, "lab_value"] = lab_table["lab_value"].values  # Lab values
-        df.loc[lab_mask, "unit"] = lab_table[
-            "unit"
-        ].values  # Units are for numeric only
-        df.loc[lab_mask, "jlac10"] = lab_table["code"].values  # Add JLAC10
-        df.loc[lab_mask, "text"] = lab_table[
-            "text"
-        ].values  # Add Japanese texts for JLAC10
+        # Lab values, units (numeric results only), JLAC10 codes, and their
+        # Japanese texts are written back in a single multi-column assignment.
+        df.loc[lab_mask, ["lab_value", "unit", "jlac10", "text"]] = lab_table[
+            ["lab_value", "unit", "code", "text"]
+        ].to_numpy()
 
     return df
 
@@ -481,11 +596,14 @@ def clean_base_table(
     file: str,
     output_dir: str,
     start_date: str,  # YYYYMMDD
-    icd10_to_mdcdx2_map: pd.DataFrame,  # Should have columns ['icd10', 'mdcdx2', 'text']
-    atc_to_yj_map: pd.DataFrame,  # Should have columns ['atc', 'yj'],
-    atc_to_hot_map: pd.DataFrame,  # Should have columns ['atc', 'hot', 'text']
-    yj_to_hot_map: pd.DataFrame,  # Should have columns ['yj', 'hot', 'text']
-    jlac10_segment_map: pd.DataFrame,  # Should have columns ['jlac10', 'text']
+    # NOTE: The maps below default to None; workers spawned by
+    #       prepare_csv_from_ai_data() receive them pre-normalized through the
+    #       pool initializer instead, so they are pickled once per process.
+    icd10_to_mdcdx2_map: pd.DataFrame = None,  # Should have columns ['icd10', 'mdcdx2', 'text']
+    atc_to_yj_map: pd.DataFrame = None,  # Should have columns ['atc', 'yj'],
+    atc_to_hot_map: pd.DataFrame = None,  # Should have columns ['atc', 'hot', 'text']
+    yj_to_hot_map: pd.DataFrame = None,  # Should have columns ['yj', 'hot', 'text']
+    jlac10_segment_map: pd.DataFrame = None,  # Should have columns ['jlac10', 'text']
     end_date: str = None,  # YYYYMMDD
     presc_type: int = 4,  # 4 is for prescriptions
     injec_type: int = 5,  # 5 is for injections
@@ -499,16 +617,22 @@ def clean_base_table(
     lab_type: int = 6,
     eot_type: int = 7,  # End of trajectory (EOT) type, currently unused
 ) -> tuple[pd.DataFrame, str, str]:
+    # Resolve the prepared code maps
+    if icd10_to_mdcdx2_map is not None:
+        # Maps passed directly (direct calls outside the worker pool)
+        maps = _prepare_maps(
+            icd10_to_mdcdx2_map=icd10_to_mdcdx2_map,
+            atc_to_yj_map=atc_to_yj_map,
+            atc_to_hot_map=atc_to_hot_map,
+            yj_to_hot_map=yj_to_hot_map,
+            jlac10_segment_map=jlac10_segment_map,
+        )
+    else:
+        # Maps prepared once per worker process by _init_worker
+        maps = _WORKER_MAPS
+        assert maps is not None, "Code maps are not set. Pass them as arguments."
     # Load
     df = pd.read_pickle(file)  # Load the base DataFrame
-    # Normalize texts
-    icd10_to_mdcdx2_map["text"] = (
-        icd10_to_mdcdx2_map["text"].str.strip().str.normalize("NFKC")
-    )
-    yj_to_hot_map["text"] = yj_to_hot_map["text"].str.strip().str.normalize("NFKC")
-    jlac10_segment_map["text"] = (
-        jlac10_segment_map["text"].str.strip().str.normalize("NFKC")
-    )
     # Normalize DataFrame
     # Ensure sortng
     df = df.sort_values(by=["age", "type"], ascending=[True, True]).reset_index(
@@ -558,7 +682,7 @@ def clean_base_table(
     df = _clean_dx(
         df=df,
         dx_type=dx_type,
-        icd10_to_mdcdx2_map=icd10_to_mdcdx2_map,
+        icd10_to_mdcdx2_map=maps.icd10_to_mdcdx2_map,
     )
     # ========================
 
@@ -569,14 +693,14 @@ def clean_base_table(
         med_type=med_type,
         presc_type=presc_type,
         injec_type=injec_type,
-        atc_to_yj_map=atc_to_yj_map,
-        atc_to_hot_map=atc_to_hot_map,
-        yj_to_hot_map=yj_to_hot_map,
+        maps=maps,
     )
     # ========================
 
     # === Clean lab ===
-    df = _clean_lab(df=df, lab_type=lab_type, jlac10_segment_map=jlac10_segment_map)
+    df = _clean_lab(
+        df=df, lab_type=lab_type, jlac10_segment_dicts=maps.jlac10_segment_dicts
+    )
     # Check missing lab values
     if (df.loc[df["type"] == lab_type, "lab_value"] == "").any():
         print(f"Warning: Some lab values are missing in {file}. Aborting.")
@@ -756,20 +880,29 @@ def prepare_csv_from_ai_data(
     jlac10_segment_map = pd.read_csv(
         jlac10_segment_map_path, header=0, encoding="utf-8", dtype=str
     )
+    # Normalize and split the maps once; every input file shares them.
+    prepared_maps = _prepare_maps(
+        icd10_to_mdcdx2_map=icd10_to_mdcdx2_map,
+        atc_to_yj_map=atc_to_yj_map,
+        atc_to_hot_map=atc_to_hot_map,
+        yj_to_hot_map=yj_to_hot_map,
+        jlac10_segment_map=jlac10_segment_map,
+    )
 
     # parallel processing
-    with ProcessPoolExecutor(max_workers=mak_workers) as executor:
+    # NOTE: The prepared maps are shipped to each worker once via the pool
+    #       initializer, instead of being pickled again with every task.
+    with ProcessPoolExecutor(
+        max_workers=mak_workers,
+        initializer=_init_worker,
+        initargs=(prepared_maps,),
+    ) as executor:
         futures = [
             executor.submit(
                 clean_base_table,
                 file=file,
                 output_dir=output_dir,
                 start_date=start_date,
-                icd10_to_mdcdx2_map=icd10_to_mdcdx2_map,
-                atc_to_yj_map=atc_to_yj_map,
-                atc_to_hot_map=atc_to_hot_map,
-                yj_to_hot_map=yj_to_hot_map,
-                jlac10_segment_map=jlac10_segment_map,
                 end_date=end_date,
             )
             for file, start_date in task_gen
@@ -30,7 +30,7 @@ from ..file_making import (
     create_oml_11,
 )
 from ..tables import udt_0112
-from ..utils import to_datetime_anything, generate_random_timedelta
+from ..utils import to_datetime_anything, generate_random_timedelta, format_base_timestamp
 from ..config import BASE_TIMESTAMP_FORMAT
 
 # message_id < 20 characters
@@ -244,7 +244,7 @@ def parse_table(
                     visit_time_dt = timestamp_dt - generate_random_timedelta(
                         min_minutes=30, max_minutes=180
                     )
-                    visit_time = visit_time_dt.strftime(BASE_TIMESTAMP_FORMAT)
+                    visit_time = format_base_timestamp(visit_time_dt)
                     # Create ADT-12 message
                     create_adt_12(
                         ssmix_root=ssmix_root,
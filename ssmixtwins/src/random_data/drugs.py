@@ -1,3 +1,7 @@
+import sys
+from collections import namedtuple
+from ..tables import merit_9_3, merit_9_4, udt_0162
+
 presc_keywords = [
     "錠",
     "カプセル",
@@ -137,131 +141,172 @@ NAME_TO_INJECTION_TYPE = {
 }
 
 # Random prescription repeat pattern forms
+# NOTE: Pattern pools are tuples (not lists): they are immutable and random.choice
+#       indexes them just the same, without the list allocation overhead at import.
+# NOTE: Entries are shared, immutable namedtuples instead of per-entry dicts.
+#       The code-system string is interned once so every pattern reuses the
+#       same "JAMISDP01" object.
+RepeatPattern = namedtuple(
+    "RepeatPattern",
+    [
+        "repeat_pattern_code",
+        "repeat_pattern_name",
+        "repeat_pattern_code_system",
+        "daily_dose",
+    ],
+)
+_JAMISDP01 = sys.intern("JAMISDP01")
 ROUTE_TO_PRESC_REPEST_PATTERNS = {
     # NOTE: daily_dose x minimum_dose = total_daily_dose
     # NOTE: Drugs without fixed minumu_dose (e.g., ointment) must not use total_daily_dose (RXE-3) and dose_unit (RXE-5).
     #       Therefore, ignore daily_dose for these drugs.
     # Oral route (The second number in the 16 digits is '0' for oral)
-    "PO": [
-        {
-            "repeat_pattern_code": "1011040000000000",
-            "repeat_pattern_name": "内服・経口・１日１回朝食後",
-            "repeat_pattern_code_system": "JAMISDP01",
-            "daily_dose": "1",
-        },
-        {
-            "repeat_pattern_code": "1012040400000000",
-            "repeat_pattern_name": "内服・経口・１日２回朝夕食後",
-            "repeat_pattern_code_system": "JAMISDP01",
-            "daily_dose": "2",
-        },
-        {
-            "repeat_pattern_code": "1013044400000000",
-            "repeat_pattern_name": "内服・経口・１日３回朝昼夕食後",
-            "repeat_pattern_code_system": "JAMISDP01",
-            "daily_dose": "3",
-        },
-    ],
+    "PO": (
+        RepeatPattern(
+            "1011040000000000",
+            "内服・経口・１日１回朝食後",
+            _JAMISDP01,
+            "1",
+        ),
+        RepeatPattern(
+            "1012040400000000",
+            "内服・経口・１日２回朝夕食後",
+            _JAMISDP01,
+            "2",
+        ),
+        RepeatPattern(
+            "1013044400000000",
+            "内服・経口・１日３回朝昼夕食後",
+            _JAMISDP01,
+            "3",
+        ),
+    ),
     # Sublingual route (The second number in the 16 digits is '1' for sublingual)
-    "SL": [
-        {
-            "repeat_pattern_code": "1111040000000000",
-            "repeat_pattern_name": "内服・舌下・１日１回朝食後",
-            "repeat_pattern_code_system": "JAMISDP01",
-            "daily_dose": "1",
-        }
-    ],
+    "SL": (
+        RepeatPattern(
+            "1111040000000000",
+            "内服・舌下・１日１回朝食後",
+            _JAMISDP01,
+            "1",
+        ),
+    ),
     # Transvaginal route (The second number in the 16 digits is 'T' for vaginal)
-    "VG": [
-        {
-            "repeat_pattern_code": "2T71000000000000",
-            "repeat_pattern_name": "外用・経膣・１日１回",
-            "repeat_pattern_code_system": "JAMISDP01",
-            "daily_dose": "1",
-        }
-    ],
+    "VG": (
+        RepeatPattern(
+            "2T71000000000000",
+            "外用・経膣・１日１回",
+            _JAMISDP01,
+            "1",
+        ),
+    ),
     # 　Inhalation route (The second number in the 16 digits is 'L' for inhalation)
-    "IH": [
-        {
-            "repeat_pattern_code": "2L71000000000000",
-            "repeat_pattern_name": "外用・吸入・１日１回",
-            "repeat_pattern_code_system": "JAMISDP01",
-            "daily_dose": "1",
-        },
-        {
-            "repeat_pattern_code": "2L72000000000000",
-            "repeat_pattern_name": "外用・吸入・１日２回",
-            "repeat_pattern_code_system": "JAMISDP01",
-            "daily_dose": "2",
-        },
-    ],
+    "IH": (
+        RepeatPattern(
+            "2L71000000000000",
+            "外用・吸入・１日１回",
+            _JAMISDP01,
+            "1",
+        ),
+        RepeatPattern(
+            "2L72000000000000",
+            "外用・吸入・１日２回",
+            _JAMISDP01,
+            "2",
+        ),
+    ),
     # Ocular route (The second number in the 16 digits is 'O' for ocular)
-    "OT": [
-        {
-            "repeat_pattern_code": "2G71000000000000",
-            "repeat_pattern_name": "外用・点耳・１日１回",
-            "repeat_pattern_code_system": "JAMISDP01",
-            "daily_dose": "1",
-        },
-        {
-            "repeat_pattern_code": "2G72000000000000",
-            "repeat_pattern_name": "外用・点耳・１日２回",
-            "repeat_pattern_code_system": "JAMISDP01",
-            "daily_dose": "2",
-        },
-    ],
+    "OT": (
+        RepeatPattern(
+            "2G71000000000000",
+            "外用・点耳・１日１回",
+            _JAMISDP01,
+            "1",
+        ),
+        RepeatPattern(
+            "2G72000000000000",
+            "外用・点耳・１日２回",
+            _JAMISDP01,
+            "2",
+        ),
+    ),
     # Ophthalmic route (The second number in the 16 digits is 'H' for ophthalmic)
-    "OP": [
-        {
-            "repeat_pattern_code": "2H71000000000000",
-            "repeat_pattern_name": "外用・点眼・１日１回",
-            "repeat_pattern_code_system": "JAMISDP01",
-            "daily_dose": "1",
-        },
-        {
-            "repeat_pattern_code": "2H72000000000000",
-            "repeat_pattern_name": "外用・点眼・１日２回",
-            "repeat_pattern_code_system": "JAMISDP01",
-            "daily_dose": "2",
-        },
-    ],
+    "OP": (
+        RepeatPattern(
+            "2H71000000000000",
+            "外用・点眼・１日１回",
+            _JAMISDP01,
+            "1",
+        ),
+        RepeatPattern(
+            "2H72000000000000",
+            "外用・点眼・１日２回",
+            _JAMISDP01,
+            "2",
+        ),
+    ),
     # Rectal route (The second number in the 16 digits is 'R' for rectal)
-    "PR": [
-        {
-            "repeat_pattern_code": "2R71000000000000",
-            "repeat_pattern_name": "外用・肛門挿入・１日１回",
-            "repeat_pattern_code_system": "JAMISDP01",
-            "daily_dose": "1",
-        },
-        {
-            "repeat_pattern_code": "2R72000000000000",
-            "repeat_pattern_name": "外用・肛門挿入・１日２回",
-            "repeat_pattern_code_system": "JAMISDP01",
-            "daily_dose": "2",
-        },
-    ],
+    "PR": (
+        RepeatPattern(
+            "2R71000000000000",
+            "外用・肛門挿入・１日１回",
+            _JAMISDP01,
+            "1",
+        ),
+        RepeatPattern(
+            "2R72000000000000",
+            "外用・肛門挿入・１日２回",
+            _JAMISDP01,
+            "2",
+        ),
+    ),
     # Transdermal route (NOTE: We use local codes for this because 'AP' can be mapped to several JAMISDP01 codes.)
-    "AP": [
-        {
-            "repeat_pattern_code": "9999000000000000",
-            "repeat_pattern_name": "外用・１日１回",
-            "repeat_pattern_code_system": "99xyz",
-            "daily_dose": "1",
-        },
-        {
-            "repeat_pattern_code": "9999000000000000",
-            "repeat_pattern_name": "外用・１日２回",
-            "repeat_pattern_code_system": "JAMISDP01",
-            "daily_dose": "2",
-        },
-    ],
+    "AP": (
+        RepeatPattern(
+            "9999000000000000",
+            "外用・１日１回",
+            "99xyz",
+            "1",
+        ),
+        RepeatPattern(
+            "9999000000000000",
+            "外用・１日２回",
+            _JAMISDP01,
+            "2",
+        ),
+    ),
     # Subcutaneous route (The second number in the 16 digits is '2' for subcutaneous)
-    "SC": [
-        {
-            "repeat_pattern_code": "3271000000000012",
-            "repeat_pattern_name": "注射・皮下・１日１回",
-            "repeat_pattern_code_system": "JAMISDP01",
-            "daily_dose": "1",
-        }
-    ],
+    "SC": (
+        RepeatPattern(
+            "3271000000000012",
+            "注射・皮下・１日１回",
+            _JAMISDP01,
+            "1",
+        ),
+    ),
 }
+
+
+# Pre-validate the tables above against the standard code tables at import.
+# Per-order validation downstream can then trust these mappings without
+# re-checking them, and a typo in a code fails fast at import instead of
+# surfacing deep inside bulk generation.
+for _route in (*NAME_TO_PRESCRIPTION_ROUTE, *ROUTE_TO_PRESC_REPEST_PATTERNS):
+    assert _route in udt_0162, f"Unknown route code in drug tables: '{_route}'."
+for _route, _patterns in ROUTE_TO_PRESC_REPEST_PATTERNS.items():
+    # Guard against single-element entries collapsing into a bare RepeatPattern
+    # when a trailing comma is dropped; random.choice would then pick one of
+    # the namedtuple's string fields mid-generation.
+    assert isinstance(_patterns, tuple) and all(
+        isinstance(_pattern, RepeatPattern) for _pattern in _patterns
+    ), f"Repeat patterns for route '{_route}' must be a tuple of RepeatPattern."
+for _form_code, _form in NAME_TO_DOSE_FORM.items():
+    assert _form_code in merit_9_3, f"Unknown dosage form code: '{_form_code}'."
+    assert _form["dose_unit_code"] == '""' or _form["dose_unit_code"] in merit_9_4, (
+        f"Unknown dose unit code for '{_form_code}': '{_form['dose_unit_code']}'."
+    )
+    assert _form["dispense_unit_code"] in merit_9_4, (
+        f"Unknown dispense unit code for '{_form_code}': '{_form['dispense_unit_code']}'."
+    )
+    # Intern the keyword strings scanned against every drug name
+    _form["keywords"] = [sys.intern(_kw) for _kw in _form["keywords"]]
+del _route, _patterns, _form_code, _form
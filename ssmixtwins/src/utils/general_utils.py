@@ -63,6 +63,47 @@ def join_fields(template: dict) -> str:
     return trimmed
 
 
+def combined_length_below(limit: int, *parts: str) -> bool:
+    """
+    Checks that the combined length of the given strings stays below a limit.
+
+    Shared by the HL7 component-length validations (`len(a)+len(b)+len(c) < N`).
+    The running total short-circuits as soon as it reaches the limit instead of
+    summing every part first.
+
+    Args:
+        limit (int): The exclusive upper bound for the combined length.
+        *parts (str): The strings whose lengths are summed.
+
+    Returns:
+        bool: True if the combined length is below the limit.
+    """
+    total = 0
+    for part in parts:
+        total += len(part)
+        if total >= limit:
+            return False
+    return True
+
+
+def zfill_order_number(order_number: str, width: int = 15) -> str:
+    """
+    Zero-pads an HL7 order number, leaving empty (null) values untouched.
+
+    Replaces the `if number != "": number = number.zfill(width)` pattern:
+    the short-circuiting `and` returns the empty string as-is without a
+    separate branch at the call site.
+
+    Args:
+        order_number (str): The order number to pad. May be empty.
+        width (int): Target width, defaults to 15 (ORC-2/ORC-3 style numbers).
+
+    Returns:
+        str: The zero-padded order number, or '' if the input was empty.
+    """
+    return order_number and order_number.zfill(width)
+
+
 def normalize_and_validate_postal_code(input_str: str) -> tuple[bool, str]:
     """
     Normalize and validate a postal code string.
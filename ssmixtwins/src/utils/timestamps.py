@@ -1,5 +1,6 @@
 import datetime
-import numpy as np
+import random
+from functools import lru_cache
 from ..config import BASE_TIMESTAMP_FORMAT
 
 DEFAULT_TIMESTAMP_FORMAT = "YYYYMMDD[HH[MM[SS]]]"
@@ -54,6 +55,25 @@ TIMESTAMP_FORMATS = {
 }
 
 
+def format_base_timestamp(dt: datetime.datetime) -> str:
+    """Formats a datetime object into BASE_TIMESTAMP_FORMAT.
+
+    This is equivalent to `dt.strftime(BASE_TIMESTAMP_FORMAT)`, but avoids
+    re-parsing the format string on every call. Because BASE_TIMESTAMP_FORMAT
+    is a fixed-width pattern, the string can be built directly with an f-string,
+    which is noticeably faster on hot paths that format one timestamp per order.
+
+    Args:
+        dt (datetime.datetime): The datetime object to format.
+    Returns:
+        str: The timestamp string in BASE_TIMESTAMP_FORMAT.
+    """
+    return (
+        f"{dt.year:04d}{dt.month:02d}{dt.day:02d}"
+        f"{dt.hour:02d}{dt.minute:02d}{dt.second:02d}{dt.microsecond:06d}"
+    )
+
+
 def to_datetime_anything(timestamp: str) -> datetime.datetime:
     """Converts any timestamp string seen in SSMIX2 to adatetime object."""
     # Force any format to YYYYMMDDHHMMSSFFFFFF
@@ -80,10 +100,16 @@ def to_datetime_anything(timestamp: str) -> datetime.datetime:
     return dt
 
 
+@lru_cache(maxsize=8192)
 def format_timestamp(
     timestamp: str, format: str = DEFAULT_TIMESTAMP_FORMAT, allow_null: bool = True
 ) -> str:
     """Formats a timestamp string into the specified format.
+
+    NOTE: Results are memoized with lru_cache. Orders generated for the same
+    file repeat identical transaction/effective times, so repeated calls with
+    the same arguments skip the strptime/strftime round trip entirely.
+
     Args:
         timestamp (str): The timestamp string to format.
             This function expects the timestamp to be in the format defined by BASE_TIMESTAMP_FORMAT.
@@ -169,7 +195,10 @@ def validate_timestamp_format(
         ) from e
 
 
+# One-millisecond base for generate_random_timedelta; multiplying this by an
+# int is a single C-level call, unlike the keyword-argument constructor.
+_ONE_MS = datetime.timedelta(milliseconds=1)
+
+
 def generate_random_timedelta(min_minutes: int, max_minutes: int):
-    random_ms = np.random.randint(min_minutes * 60 * 1000, max_minutes * 60 * 1000)
-    random_td = datetime.timedelta(milliseconds=random_ms)
-    return random_td
+    return _ONE_MS * random.randrange(min_minutes * 60 * 1000, max_minutes * 60 * 1000)